@@ -13,11 +13,15 @@ WinRecent Explorer – Historique des éléments consultés (Windows) – GUI Tk
 import os
 import sys
 import csv
-import shutil
 import sqlite3
+import struct
+import uuid
 import subprocess
+import threading
 import ctypes
 import ctypes.wintypes as wt
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Optional, List, Tuple
@@ -29,6 +33,7 @@ from tkinter import ttk, filedialog, messagebox
 APP_NAME = "WinRecent Explorer"
 TASK_NAME = "RecentHistory_AutoScanWeekly"
 DEFAULT_LOOKBACK_DAYS = 730  # 2 ans
+PAGE_SIZE = 500  # lignes chargées à la fois dans le tableau (page suivante au défilement)
 RECENT_DIR = Path(os.environ.get("APPDATA", "")) / "Microsoft" / "Windows" / "Recent"
 DB_DIR = Path(os.environ.get("LOCALAPPDATA", "")) / "RecentHistory"
 DB_PATH = DB_DIR / "history.db"
@@ -73,15 +78,29 @@ LPIShellLinkW = ctypes.POINTER(IShellLinkW)
 LPIPersistFile = ctypes.POINTER(IPersistFile)
 
 class IShellLinkW_VTable(ctypes.Structure):
+    # Ordre exact de shobjidl.h (IUnknown puis IShellLinkW) : GetPath = slot 3, Resolve = slot 19
     _fields_ = [
         ("QueryInterface", ctypes.c_void_p),
         ("AddRef", ctypes.c_void_p),
         ("Release", ctypes.c_void_p),
-        *[(f"slot{i}", ctypes.c_void_p) for i in range(3, 20)],
         ("GetPath", ctypes.c_void_p),
         ("GetIDList", ctypes.c_void_p),
         ("SetIDList", ctypes.c_void_p),
         ("GetDescription", ctypes.c_void_p),
+        ("SetDescription", ctypes.c_void_p),
+        ("GetWorkingDirectory", ctypes.c_void_p),
+        ("SetWorkingDirectory", ctypes.c_void_p),
+        ("GetArguments", ctypes.c_void_p),
+        ("SetArguments", ctypes.c_void_p),
+        ("GetHotkey", ctypes.c_void_p),
+        ("SetHotkey", ctypes.c_void_p),
+        ("GetShowCmd", ctypes.c_void_p),
+        ("SetShowCmd", ctypes.c_void_p),
+        ("GetIconLocation", ctypes.c_void_p),
+        ("SetIconLocation", ctypes.c_void_p),
+        ("SetRelativePath", ctypes.c_void_p),
+        ("Resolve", ctypes.c_void_p),
+        ("SetPath", ctypes.c_void_p),
     ]
 IShellLinkW._fields_ = [("lpVtbl", ctypes.POINTER(IShellLinkW_VTable))]
 
@@ -99,62 +118,164 @@ class IPersistFile_VTable(ctypes.Structure):
     ]
 IPersistFile._fields_ = [("lpVtbl", ctypes.POINTER(IPersistFile_VTable))]
 
+# Prototypes des méthodes COM utilisées, construits une fois à l'import
+QIProto      = ctypes.WINFUNCTYPE(wt.HRESULT, LPIShellLinkW, ctypes.POINTER(wt.GUID), ctypes.POINTER(ctypes.c_void_p))
+ReleaseProto = ctypes.WINFUNCTYPE(ctypes.c_ulong, ctypes.c_void_p)
 GetPathProto = ctypes.WINFUNCTYPE(wt.HRESULT, LPIShellLinkW, wt.LPWSTR, ctypes.c_int, ctypes.c_void_p, ctypes.c_uint)
 PFLoadProto  = ctypes.WINFUNCTYPE(wt.HRESULT, LPIPersistFile, wt.LPCOLESTR, ctypes.c_uint)
 
 ole32 = ctypes.OleDLL("ole32")
 CoCreateInstance = ole32.CoCreateInstance
 CoInitialize     = ole32.CoInitialize
+CoInitializeEx   = ole32.CoInitializeEx
 CoUninitialize   = ole32.CoUninitialize
 CoCreateInstance.argtypes = [
     ctypes.POINTER(wt.GUID), ctypes.c_void_p, ctypes.c_uint,
     ctypes.POINTER(wt.GUID), ctypes.POINTER(ctypes.c_void_p)
 ]
 CLSCTX_INPROC_SERVER = 1
+COINIT_MULTITHREADED = 0x0
 
-def resolve_lnk(lnk_path: Path) -> str:
-    """Résout un .lnk vers sa cible (chemin réel). Retourne '' en cas d'échec."""
-    if not lnk_path.exists() or lnk_path.suffix.lower() != ".lnk":
-        return ""
-    CoInitialize(None)
+SLGP_RAWPATH = 0x0000
+MAX_PATH = 260
+MAX_LONG_PATH = 32768
+
+# ===================== Lecture directe des .lnk (format MS-SHLLINK) =====================
+_LNK_HEADER = struct.Struct("<I16sI")       # HeaderSize, LinkCLSID, LinkFlags
+_LNK_INFO = struct.Struct("<7I")            # LinkInfoSize, HeaderSize, Flags, VolumeIDOffset,
+                                            # LocalBasePathOffset, CommonNetworkRelativeLinkOffset, CommonPathSuffixOffset
+_LNK_CLSID = uuid.UUID("00021401-0000-0000-C000-000000000046").bytes_le
+HAS_LINK_TARGET_IDLIST = 0x0001
+HAS_LINK_INFO          = 0x0002
+FORCE_NO_LINK_INFO     = 0x0100
+VOLUME_ID_AND_LOCAL_BASE_PATH = 0x0001
+
+def _lnk_astr(data: bytes, start: int) -> str:
+    return data[start:data.index(b"\0", start)].decode("mbcs", "replace")
+
+def _lnk_wstr(data: bytes, start: int) -> str:
+    return data[start:].decode("utf-16-le", "replace").split("\0", 1)[0]
+
+def parse_lnk_fast(lnk_path: str) -> str:
+    """
+    Lit le chemin cible local d'un .lnk directement dans le fichier (sans COM).
+    Retourne '' si le lien n'a pas de chemin local (cible réseau seule, ID list seule…)
+    ou si le fichier est illisible : l'appelant bascule alors sur COM.
+    """
     try:
-        psl = ctypes.c_void_p()
-        hr = CoCreateInstance(
-            ctypes.byref(CLSID_ShellLink), None, CLSCTX_INPROC_SERVER,
-            ctypes.byref(IID_IShellLinkW), ctypes.byref(psl)
-        )
-        if (getattr(hr, "value", hr) != 0) or not psl:
+        with open(lnk_path, "rb") as f:
+            data = f.read()
+        header_size, clsid, flags = _LNK_HEADER.unpack_from(data, 0)
+        if header_size != 0x4C or clsid != _LNK_CLSID:
             return ""
-        shell_link = ctypes.cast(psl, LPIShellLinkW)
-        QI = ctypes.WINFUNCTYPE(
-            wt.HRESULT, LPIShellLinkW, ctypes.POINTER(wt.GUID), ctypes.POINTER(ctypes.c_void_p)
-        )(shell_link.lpVtbl.contents.QueryInterface)
-        ppv = ctypes.c_void_p()
-        if QI(shell_link, ctypes.byref(IID_IPersistFile), ctypes.byref(ppv)) != 0 or not ppv:
+        pos = header_size
+        if flags & HAS_LINK_TARGET_IDLIST:
+            pos += 2 + struct.unpack_from("<H", data, pos)[0]
+        if not flags & HAS_LINK_INFO or flags & FORCE_NO_LINK_INFO:
             return ""
-        persist_file = ctypes.cast(ppv, LPIPersistFile)
-        pf_load = PFLoadProto(persist_file.lpVtbl.contents.Load)
-        if pf_load(persist_file, str(lnk_path), 0) != 0:
+        _size, info_hsize, info_flags, _vol, base_off, _net, suffix_off = _LNK_INFO.unpack_from(data, pos)
+        if not info_flags & VOLUME_ID_AND_LOCAL_BASE_PATH:
             return ""
-        get_path = GetPathProto(shell_link.lpVtbl.contents.GetPath)
-        buf = ctypes.create_unicode_buffer(1024)
-        SLGP_RAWPATH = 0x0000
-        if get_path(shell_link, buf, 1024, None, SLGP_RAWPATH) != 0:
-            return ""
-        return buf.value or ""
-    except Exception:
+        if info_hsize >= 0x24:
+            base_off_u, suffix_off_u = struct.unpack_from("<2I", data, pos + 28)
+            if base_off_u:
+                suffix = _lnk_wstr(data, pos + suffix_off_u) if suffix_off_u else ""
+                return _lnk_wstr(data, pos + base_off_u) + suffix
+        target = _lnk_astr(data, pos + base_off) + _lnk_astr(data, pos + suffix_off)
+        # '?' = caractère non représentable dans la page de code ANSI : COM donnera le vrai nom
+        return "" if "?" in target else target
+    except (OSError, ValueError, struct.error):
         return ""
-    finally:
-        try: CoUninitialize()
-        except Exception: pass
 
-# ===================== UTIL =====================
-def file_mtime_dt(path: Path) -> datetime:
-    try:
-        return datetime.fromtimestamp(path.stat().st_mtime)
-    except Exception:
-        return datetime.min
+class _ShellLinkResolver:
+    """
+    Résolveur .lnk réutilisable pour tout un scan. Lecture directe du fichier (parse_lnk_fast),
+    COM en secours seulement : CoInitialize + CoCreateInstance(ShellLink) + QueryInterface(IPersistFile)
+    faits une seule fois, au premier lien qui en a besoin, puis Load/GetPath par fichier.
+    Usage : with _ShellLinkResolver() as r: r.resolve(lnk)
+    multithreaded=True : appartement MTA (threads du pool de scan).
+    """
+    def __init__(self, multithreaded: bool = False):
+        self.sl = None
+        self.pf = None
+        self._com_init = False
+        self._com_tried = False
+        self._mta = multithreaded
+
+    def __enter__(self):
+        return self
+
+    def _open_com(self):
+        self._com_tried = True
+        try:
+            if self._mta:
+                CoInitializeEx(None, COINIT_MULTITHREADED)
+            else:
+                CoInitialize(None)
+            self._com_init = True
+            psl = ctypes.c_void_p()
+            hr = CoCreateInstance(
+                ctypes.byref(CLSID_ShellLink), None, CLSCTX_INPROC_SERVER,
+                ctypes.byref(IID_IShellLinkW), ctypes.byref(psl)
+            )
+            if (getattr(hr, "value", hr) != 0) or not psl:
+                return
+            self.sl = ctypes.cast(psl, LPIShellLinkW)
+            QI = QIProto(self.sl.contents.lpVtbl.contents.QueryInterface)
+            ppv = ctypes.c_void_p()
+            hr = QI(self.sl, ctypes.byref(IID_IPersistFile), ctypes.byref(ppv))
+            if (getattr(hr, "value", hr) != 0) or not ppv:
+                return
+            self.pf = ctypes.cast(ppv, LPIPersistFile)
+            self.pf_load = PFLoadProto(self.pf.contents.lpVtbl.contents.Load)
+            self.get_path = GetPathProto(self.sl.contents.lpVtbl.contents.GetPath)
+            self.buf = (ctypes.c_wchar * MAX_PATH)()  # agrandi seulement si une cible dépasse MAX_PATH
+        except Exception:
+            self.pf = None
+
+    def resolve(self, lnk_path: str) -> str:
+        """
+        Résout un .lnk (chemin str) vers sa cible (chemin réel). Retourne '' en cas d'échec.
+        Volontairement sans IShellLink::Resolve : on lit le chemin enregistré (SLGP_RAWPATH)
+        sans passer par le service de suivi ni revalider les lecteurs/partages disparus.
+        """
+        target = parse_lnk_fast(lnk_path)
+        if target:
+            return target
+        if not self._com_tried:
+            self._open_com()
+        if self.pf is None:
+            return ""
+        try:
+            hr = self.pf_load(self.pf, lnk_path, 0)
+            if getattr(hr, "value", hr) != 0:
+                return ""
+            hr = self.get_path(self.sl, self.buf, len(self.buf), None, SLGP_RAWPATH)
+            # GetPath tronque sans renvoyer d'erreur : un tampon plein = cible plus longue, on relit en grand
+            if len(self.buf) < MAX_LONG_PATH and len(self.buf.value) >= len(self.buf) - 1:
+                self.buf = (ctypes.c_wchar * MAX_LONG_PATH)()
+                hr = self.get_path(self.sl, self.buf, len(self.buf), None, SLGP_RAWPATH)
+            if getattr(hr, "value", hr) != 0:
+                return ""
+            return self.buf.value or ""
+        except Exception:
+            return ""
+
+    def __exit__(self, *exc):
+        for obj in (self.pf, self.sl):
+            if obj:
+                try:
+                    ReleaseProto(obj.contents.lpVtbl.contents.Release)(obj)
+                except Exception:
+                    pass
+        self.pf = self.sl = None
+        if self._com_init:
+            try: CoUninitialize()
+            except Exception: pass
+            self._com_init = False
+        return False
 
+# ===================== UTIL =====================
 def _app_dir() -> Path:
     """Dossier où écrire le log : dossier de l'exe (si packagé) sinon du script .py."""
     try:
@@ -165,10 +286,52 @@ def _app_dir() -> Path:
         return Path.cwd()
 
 # ===================== DB =====================
+# Requêtes des chemins chauds : texte constant -> réutilisation du cache de statements préparés
+_SQL_UPSERT = """
+    INSERT INTO items(target_path, display_name, source, opened_at, opened_at_epoch,
+                      exists_now, lnk_mtime_ns, lnk_size)
+    VALUES(?,?,?,?,?,?,?,?)
+    ON CONFLICT(target_path, opened_at) DO UPDATE SET
+        display_name=excluded.display_name,
+        source=excluded.source,
+        exists_now=COALESCE(excluded.exists_now, items.exists_now),
+        lnk_mtime_ns=excluded.lnk_mtime_ns,
+        lnk_size=excluded.lnk_size
+"""
+_SQL_LNK_FINGERPRINT = (
+    "SELECT target_path FROM items WHERE display_name=? AND lnk_mtime_ns=? AND lnk_size=? LIMIT 1"
+)
+_SQL_SELECT_RANGE = """
+    SELECT opened_at, display_name, target_path, source, exists_now
+    FROM items
+    WHERE opened_at_epoch BETWEEN ? AND ?
+    ORDER BY opened_at_epoch DESC
+    LIMIT ? OFFSET ?
+"""
+_SQL_SELECT_RANGE_TEXT = """
+    SELECT opened_at, display_name, target_path, source, exists_now
+    FROM items
+    WHERE opened_at_epoch BETWEEN ? AND ?
+      AND (instr(PYLOWER(display_name), ?) > 0 OR instr(PYLOWER(target_path), ?) > 0)
+    ORDER BY opened_at_epoch DESC
+    LIMIT ? OFFSET ?
+"""
+
 def ensure_db():
     DB_DIR.mkdir(parents=True, exist_ok=True)
-    con = sqlite3.connect(DB_PATH)
+    # isolation_level=None : autocommit, les transactions sont ouvertes explicitement (BEGIN/COMMIT)
+    con = sqlite3.connect(DB_PATH, isolation_level=None, cached_statements=256)
+    # lower() de SQLite (et LIKE) ne replie la casse que sur l'ASCII : 'É' doit trouver 'é'
+    con.create_function("PYLOWER", 1, lambda v: v.lower() if v else "", deterministic=True)
     cur = con.cursor()
+    cur.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA mmap_size=268435456;
+        PRAGMA cache_size=-20000;
+        PRAGMA foreign_keys=OFF;
+    """)
     cur.execute("""
         CREATE TABLE IF NOT EXISTS items (
             id INTEGER PRIMARY KEY,
@@ -176,33 +339,101 @@ def ensure_db():
             display_name TEXT,
             source TEXT,
             opened_at TEXT, -- ISO
-            exists_now INTEGER
+            opened_at_epoch INTEGER, -- même instant en secondes Unix (filtres par période)
+            exists_now INTEGER,
+            lnk_mtime_ns INTEGER, -- empreinte du .lnk (cache de résolution)
+            lnk_size INTEGER
         )
     """)
+    cur.execute("PRAGMA table_info(items)")
+    cols = {row[1] for row in cur.fetchall()}
+    if "lnk_mtime_ns" not in cols:
+        cur.execute("ALTER TABLE items ADD COLUMN lnk_mtime_ns INTEGER")
+    if "lnk_size" not in cols:
+        cur.execute("ALTER TABLE items ADD COLUMN lnk_size INTEGER")
+    if "opened_at_epoch" not in cols:
+        cur.execute("ALTER TABLE items ADD COLUMN opened_at_epoch INTEGER")
     cur.execute("CREATE INDEX IF NOT EXISTS idx_items_opened_at ON items(opened_at)")
     cur.execute("CREATE INDEX IF NOT EXISTS idx_items_target ON items(target_path)")
+    # Index couvrant pour App.query_rows (bornes et tri sur l'entier opened_at_epoch)
+    cur.execute("DROP INDEX IF EXISTS idx_items_opened_cover")
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_items_epoch_cover
+        ON items(opened_at_epoch DESC, opened_at, display_name, target_path, source, exists_now)
+    """)
+    # Lignes antérieures à la colonne : opened_at est une heure locale, 'utc' la convertit en epoch
+    cur.execute("""
+        UPDATE items SET opened_at_epoch = CAST(strftime('%s', opened_at, 'utc') AS INTEGER)
+        WHERE opened_at_epoch IS NULL
+    """)
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_items_lnkfp ON items(display_name, lnk_mtime_ns, lnk_size)")
+    # Clé d'upsert (target_path, opened_at) : on purge d'éventuels doublons hérités avant l'index UNIQUE
+    cur.execute("SELECT 1 FROM sqlite_master WHERE type='index' AND name='idx_items_target_opened'")
+    if cur.fetchone() is None:
+        cur.execute("""
+            DELETE FROM items WHERE id NOT IN (
+                SELECT MIN(id) FROM items GROUP BY target_path, opened_at
+            )
+        """)
+        cur.execute("CREATE UNIQUE INDEX idx_items_target_opened ON items(target_path, opened_at)")
     con.commit()
     return con
 
-def upsert_item(con, target_path: str, display_name: str, source: str, opened_at: datetime) -> bool:
-    """Insère si nouveau couple (target_path, opened_at). Retourne True si INSERT, False sinon."""
+def upsert_items(con, rows: List[tuple]) -> List[Tuple[str, str]]:
+    """
+    Upsert groupé en une seule transaction.
+    rows = [(target_path, display_name, source, opened_at_iso, opened_at_epoch, exists_now, lnk_mtime_ns, lnk_size)]
+    exists_now=None (cible UNC non vérifiée) conserve la valeur déjà en base.
+    Retourne [(display_name, opened_at_iso)] pour les lignes réellement INSÉRÉES.
+    """
     cur = con.cursor()
-    cur.execute("SELECT id FROM items WHERE target_path=? AND opened_at=?", (target_path, opened_at.isoformat()))
-    row = cur.fetchone()
-    exists_now = 1 if (target_path and Path(target_path).exists()) else 0
-    if row:
-        cur.execute("UPDATE items SET display_name=?, source=?, exists_now=? WHERE id=?",
-                    (display_name, source, exists_now, row[0]))
-        con.commit()
-        return False
-    else:
-        cur.execute("""INSERT INTO items(target_path, display_name, source, opened_at, exists_now)
-                       VALUES(?,?,?,?,?)""",
-                    (target_path, display_name, source, opened_at.isoformat(), exists_now))
-        con.commit()
-        return True
+    # IMMEDIATE : verrou d'écriture pris avant de lire MAX(id), pour qu'un autre écrivain (tâche planifiée,
+    # autre version) ne puisse pas insérer entre cette lecture et celle des lignes ajoutées
+    cur.execute("BEGIN IMMEDIATE")
+    try:
+        cur.execute("SELECT COALESCE(MAX(id), 0) FROM items")
+        last_id = cur.fetchone()[0]
+        cur.executemany(_SQL_UPSERT, rows)
+        cur.execute("SELECT display_name, opened_at FROM items WHERE id > ?", (last_id,))
+        added = cur.fetchall()
+        cur.execute("COMMIT")
+    except Exception:
+        cur.execute("ROLLBACK")
+        raise
+    return added
 
 # ===================== SCAN =====================
+SCAN_WORKERS = min(8, os.cpu_count() or 1)
+
+def _target_exists(target: str) -> Optional[int]:
+    """
+    1/0 selon que la cible existe. None pour un chemin UNC (partage réseau) :
+    un stat sur un partage absent peut bloquer plusieurs secondes, il est fait à l'affichage.
+    """
+    if not target:
+        return 0
+    if target.startswith("\\\\"):
+        return None
+    try:
+        os.stat(target)
+        return 1
+    except OSError:
+        return 0
+
+def _scan_row(target: str, display: str, st: os.stat_result) -> tuple:
+    """Ligne prête pour upsert_items ; opened_at ≈ date dernière ouverture (mtime du .lnk)."""
+    mtime = st.st_mtime
+    return (target, display, "Recent(.lnk)", datetime.fromtimestamp(mtime).isoformat(), int(mtime),
+            _target_exists(target), st.st_mtime_ns, st.st_size)
+
+def _resolve_chunk(items: List[Tuple[str, str, os.stat_result]]) -> List[tuple]:
+    """Worker du pool : résout une partie des .lnk dans son propre appartement COM (MTA)."""
+    out = []
+    with _ShellLinkResolver(multithreaded=True) as r:
+        for lnk_path, display, st in items:
+            out.append(_scan_row(r.resolve(lnk_path), display, st))
+    return out
+
 def scan_recent(con) -> Tuple[int, List[Tuple[str, str]]]:
     """
     Parcourt le dossier 'Recent'. Retourne:
@@ -211,27 +442,64 @@ def scan_recent(con) -> Tuple[int, List[Tuple[str, str]]]:
     """
     if not RECENT_DIR.exists():
         return 0, []
-    count = 0
-    added: List[Tuple[str, str]] = []
-    for lnk in RECENT_DIR.glob("*.lnk"):
-        opened_at = file_mtime_dt(lnk)  # ≈ date dernière ouverture
-        target = resolve_lnk(lnk)
-        display = lnk.stem
-        inserted = upsert_item(con, target, display, "Recent(.lnk)", opened_at)
-        count += 1
-        if inserted:
-            added.append((display, opened_at.isoformat()))
-    return count, added
+    rows = []
+    to_resolve: List[Tuple[str, str, os.stat_result]] = []
+    cur = con.cursor()
+    # os.scandir : le stat vient de l'énumération du dossier (FindFirstFile), pas de 2e appel système
+    with os.scandir(RECENT_DIR) as it:
+        for de in it:
+            if not de.name.lower().endswith(".lnk"):
+                continue
+            try:
+                st = de.stat()
+            except OSError:
+                continue
+            display = de.name[:-4]
+            # .lnk inchangé depuis le dernier scan (même nom, mtime, taille) : cible connue, pas de COM
+            cur.execute(_SQL_LNK_FINGERPRINT, (display, st.st_mtime_ns, st.st_size))
+            hit = cur.fetchone()
+            if hit is not None:
+                rows.append(_scan_row(hit[0] or "", display, st))
+            else:
+                to_resolve.append((de.path, display, st))
+
+    # Résolution COM en parallèle (un résolveur par thread), écritures SQLite dans ce thread
+    if to_resolve:
+        n = min(SCAN_WORKERS, len(to_resolve))
+        chunks = [to_resolve[i::n] for i in range(n)]
+        with ThreadPoolExecutor(max_workers=n) as pool:
+            for part in pool.map(_resolve_chunk, chunks):
+                rows.extend(part)
+
+    if not rows:
+        return 0, []
+    added = upsert_items(con, rows)
+    return len(rows), added
 
 # ===================== TÂCHE PLANIFIÉE =====================
+class _NormTable(dict):
+    """Table str.translate pour _norm_name, remplie à la demande : alphanumérique -> minuscule, le reste supprimé."""
+    def __missing__(self, code):
+        ch = chr(code)
+        v = self[code] = ch.lower() if ch.isalnum() else None
+        return v
+
+_NORM_TABLE = _NormTable()
+
+try:
+    _SCRIPT_PATH: Optional[Path] = Path(__file__).resolve()  # résolu une fois (resolve() stat chaque composant)
+except Exception:
+    _SCRIPT_PATH = None
+
+@functools.lru_cache(maxsize=None)
 def _norm_name(s: str) -> str:
-    return "".join(ch.lower() for ch in s if ch.isalnum())
+    return s.translate(_NORM_TABLE)
 
+@functools.lru_cache(maxsize=None)
 def _preferred_exe_for_this_script() -> Optional[Path]:
     """Retourne l'exe correspondant au nom du script (même dossier puis ./dist/), variantes nom acceptées."""
-    try:
-        script = Path(__file__).resolve()
-    except Exception:
+    script = _SCRIPT_PATH
+    if script is None:
         return None
     stem = script.stem
     cand = script.with_suffix(".exe")
@@ -264,9 +532,8 @@ def create_weekly_task():
     if used_exe:
         tr_cmd = f'"{run_target}" --weekly-scan'
     else:
-        try:
-            script_path = Path(__file__).resolve()
-        except Exception:
+        script_path = _SCRIPT_PATH
+        if script_path is None:
             return False, "Impossible de déterminer le chemin du script."
         py = Path(sys.executable).resolve()
         tr_cmd = f'"{py}" "{script_path}" --weekly-scan'
@@ -343,6 +610,13 @@ class App(tk.Tk):
         self.minsize(900, 560)
 
         self.con = ensure_db()
+        self._cur = self.con.cursor()  # réutilisé par query_rows
+        self._exists_cache = {}  # target_path -> bool (cibles UNC vérifiées à l'affichage)
+        # Pagination du tableau : filtre courant, nb de lignes chargées, reste-t-il des lignes
+        self._filter = None
+        self._offset = 0
+        self._has_more = False
+        self._page_pending = False
 
         # --- Barre du haut ---
         top = ttk.Frame(self)
@@ -363,7 +637,8 @@ class App(tk.Tk):
         ttk.Entry(top, textvariable=self.to_var, width=12).pack(side="left")
 
         ttk.Button(top, text="Appliquer filtres", command=self.refresh_table).pack(side="left", padx=8)
-        ttk.Button(top, text="Scanner maintenant", command=self.scan_now).pack(side="left", padx=8)
+        self._scan_btn = ttk.Button(top, text="Scanner maintenant", command=self.scan_now)
+        self._scan_btn.pack(side="left", padx=8)
         ttk.Button(top, text="Exporter CSV", command=self.export_csv).pack(side="left", padx=8)
 
         # --- Tableau ---
@@ -377,7 +652,8 @@ class App(tk.Tk):
 
         yscroll = ttk.Scrollbar(table, orient="vertical", command=self.tree.yview)
         xscroll = ttk.Scrollbar(table, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=yscroll.set, xscrollcommand=xscroll.set)
+        self._yscroll = yscroll
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll, xscrollcommand=xscroll.set)
 
         self.tree.heading("opened_at", text="Date d'ouverture")
         self.tree.heading("display_name", text="Nom")
@@ -416,38 +692,114 @@ class App(tk.Tk):
     # ----- Helpers -----
     def parse_dates(self):
         def parse(s, default):
+            s = s.strip()
+            try:
+                return datetime.fromisoformat(s)  # YYYY-MM-DD, parseur C (cas courant)
+            except ValueError:
+                pass
             try:
-                return datetime.strptime(s.strip(), "%Y-%m-%d")
-            except Exception:
+                return datetime.strptime(s, "%Y-%m-%d")  # dates non complétées : 2024-3-1
+            except ValueError:
                 return default
         dfrom = parse(self.from_var.get(), datetime.now() - timedelta(days=DEFAULT_LOOKBACK_DAYS))
         dto = parse(self.to_var.get(), datetime.now())
         return dfrom, dto.replace(hour=23, minute=59, second=59, microsecond=999999)
 
-    def query_rows(self, dfrom, dto):
-        cur = self.con.cursor()
-        cur.execute("""
-            SELECT opened_at, display_name, target_path, source, exists_now
-            FROM items
-            WHERE datetime(opened_at) BETWEEN ? AND ?
-            ORDER BY datetime(opened_at) DESC
-        """, (dfrom.isoformat(), dto.isoformat()))
+    def query_rows(self, dfrom, dto, q: str = "", limit: int = -1, offset: int = 0):
+        """
+        Lignes de la période, filtrées côté SQLite (sous-chaîne sur nom ou chemin, insensible à la casse,
+        accents compris : str.lower via PYLOWER).
+        limit/offset : pagination (-1 = pas de limite).
+        """
+        cur = self._cur
+        if not q:
+            cur.execute(_SQL_SELECT_RANGE, (int(dfrom.timestamp()), int(dto.timestamp()), limit, offset))
+        else:
+            q = q.lower()
+            cur.execute(_SQL_SELECT_RANGE_TEXT,
+                        (int(dfrom.timestamp()), int(dto.timestamp()), q, q, limit, offset))
         return cur.fetchall()
 
+    def stream_rows(self, dfrom, dto):
+        """Comme query_rows (sans filtre texte) mais par lots de 1000 via fetchmany : mémoire constante."""
+        cur = self.con.cursor()  # curseur propre : le générateur vit pendant tout l'export
+        cur.arraysize = 1000
+        cur.execute(_SQL_SELECT_RANGE, (int(dfrom.timestamp()), int(dto.timestamp()), -1, 0))
+        while True:
+            rows = cur.fetchmany()
+            if not rows:
+                break
+            yield from rows
+
     # ----- UI actions -----
     def refresh_table(self):
-        for i in self.tree.get_children():
-            self.tree.delete(i)
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
         dfrom, dto = self.parse_dates()
-        q = self.search_var.get().strip().lower()
-        for opened_at, name, path, source, exists_now in self.query_rows(dfrom, dto):
-            if q and q not in (name or "").lower() and q not in (path or "").lower():
-                continue
-            exists_label = "Oui" if exists_now else "Non"
-            self.tree.insert("", "end", values=(opened_at.replace("T", " ")[:19], name, path, source, exists_label))
+        self._filter = (dfrom, dto, self.search_var.get().strip())
+        self._offset = 0
+        self._load_next_page()
+
+    def _load_next_page(self):
+        """Ajoute au tableau les PAGE_SIZE lignes suivantes du filtre courant."""
+        dfrom, dto, q = self._filter
+        rows = self.query_rows(dfrom, dto, q, PAGE_SIZE, self._offset)
+        self._offset += len(rows)
+        self._has_more = len(rows) == PAGE_SIZE
+        insert = self.tree.insert
+        lazy_exists = self._lazy_exists
+        for opened_at, name, path, source, exists_now in rows:
+            if exists_now is None:
+                exists_now = lazy_exists(path)
+            insert("", "end", values=(opened_at.replace("T", " ")[:19], name, path, source,
+                                      "Oui" if exists_now else "Non"))
+
+    def _on_tree_yscroll(self, first, last):
+        """yscrollcommand du tableau : suit la barre et charge la page suivante à l'approche du bas."""
+        self._yscroll.set(first, last)
+        if self._has_more and not self._page_pending and float(last) > 0.9:
+            self._page_pending = True
+            self.after_idle(self._load_page_when_idle)
+
+    def _load_page_when_idle(self):
+        self._page_pending = False
+        if self._has_more:
+            self._load_next_page()
+
+    def _lazy_exists(self, path: str) -> bool:
+        """Stat différé (cibles UNC) limité aux lignes affichées, mémorisé pour la session."""
+        hit = self._exists_cache.get(path)
+        if hit is None:
+            hit = self._exists_cache[path] = bool(path) and os.path.exists(path)
+        return hit
 
     def scan_now(self):
-        count, _ = scan_recent(self.con)  # on ignore la liste des ajouts en mode GUI
+        """Lance le scan dans un thread : l'interface reste utilisable pendant la résolution des .lnk."""
+        self._scan_btn.config(state="disabled")
+        self.status_var.set("Scan en cours…")
+        threading.Thread(target=self._scan_worker, daemon=True).start()
+
+    def _scan_worker(self):
+        # Connexion dédiée : un objet sqlite3.Connection ne se partage pas entre threads
+        try:
+            con = ensure_db()
+            try:
+                count, _ = scan_recent(con)  # on ignore la liste des ajouts en mode GUI
+            finally:
+                con.close()
+        except Exception as e:
+            self.after(0, self._scan_done, None, e)
+        else:
+            self.after(0, self._scan_done, count, None)
+
+    def _scan_done(self, count, error):
+        """Retour dans le thread Tk : rafraîchit le tableau et réactive le bouton."""
+        self._scan_btn.config(state="normal")
+        self.status_var.set("")
+        if error is not None:
+            messagebox.showerror(APP_NAME, f"Échec du scan:\n{error}")
+            return
         self.refresh_table()
         messagebox.showinfo(APP_NAME, f"Scan terminé.\n{count} élément(s) importé(s) depuis 'Recent'.")
 
@@ -520,12 +872,10 @@ class App(tk.Tk):
         if not path:
             return
         dfrom, dto = self.parse_dates()
-        rows = self.query_rows(dfrom, dto)
         with open(path, "w", newline="", encoding="utf-8") as f:
             w = csv.writer(f, delimiter=";")
             w.writerow(["opened_at", "name", "path", "source", "exists"])
-            for opened_at, name, path, source, exists_now in rows:
-                w.writerow([opened_at, name, path, source, "1" if exists_now else "0"])
+            w.writerows((oa, n, p, s, "1" if e else "0") for oa, n, p, s, e in self.stream_rows(dfrom, dto))
         messagebox.showinfo(APP_NAME, f"Exporté vers:\n{path}")
 
     def backup_db(self):
@@ -536,8 +886,13 @@ class App(tk.Tk):
         if not path:
             return
         try:
-            self.con.commit()
-            shutil.copy2(DB_PATH, path)
+            # API de sauvegarde en ligne : copie cohérente page par page, WAL compris
+            dest = sqlite3.connect(path)
+            try:
+                with dest:
+                    self.con.backup(dest, pages=1000)
+            finally:
+                dest.close()
             messagebox.showinfo(APP_NAME, f"Copie réalisée:\n{path}")
         except Exception as e:
             messagebox.showerror(APP_NAME, f"Échec de la sauvegarde:\n{e}")
@@ -15,14 +15,18 @@ WinRecent Explorer – Historique des éléments consultés (Windows)
 """
 
 import os
+import re
 import sys
 import csv
+import heapq
 import shutil
 import sqlite3
 import subprocess
+import threading
 import ctypes
 import ctypes.wintypes as wt
 from pathlib import Path
+import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
 from typing import Optional, List, Tuple
 
@@ -36,10 +40,16 @@ DEFAULT_LOOKBACK_DAYS = 730
 RECENT_DIR = Path(os.environ.get("APPDATA", "")) / "Microsoft" / "Windows" / "Recent"
 DB_DIR = Path(os.environ.get("LOCALAPPDATA", "")) / "RecentHistory"
 DB_PATH = DB_DIR / "history.db"
+PAGE_SIZE = 500  # lignes chargées à la fois dans le tableau (page suivante au défilement)
 
 # Rétention des sauvegardes au démarrage
 STARTUP_BACKUP_KEEP_LAST = 3  # ne garder que les 3 dernières sauvegardes
 
+# Entretien de la base
+ANALYZE_AFTER_INSERTS = 1000   # ANALYZE items après ce nombre d'insertions cumulées
+VACUUM_FREE_RATIO = 0.10       # VACUUM si plus de 10 % de pages libres...
+VACUUM_MIN_INTERVAL_DAYS = 7   # ...et au plus une fois par semaine
+
 # ===================== COM / ShellLink =====================
 if not hasattr(wt, "GUID"):
     class GUID(ctypes.Structure):
@@ -80,12 +90,6 @@ CoInitialize = ole32.CoInitialize
 CoUninitialize = ole32.CoUninitialize
 
 # ===================== UTIL =====================
-def file_mtime_dt(path: Path) -> datetime:
-    try:
-        return datetime.fromtimestamp(path.stat().st_mtime)
-    except Exception:
-        return datetime.min
-
 def _app_dir() -> Path:
     """Dossier de l'exécutable PyInstaller si gelé, sinon dossier du script; repli sur CWD."""
     try:
@@ -95,48 +99,78 @@ def _app_dir() -> Path:
     except Exception:
         return Path.cwd()
 
-def startup_backup_db_to_app_dir() -> Optional[Path]:
+def _db_last_change(db_path: Path) -> float:
+    """mtime du dernier changement de la DB, en tenant compte du journal WAL non encore reporté."""
+    mtime = db_path.stat().st_mtime
+    try:
+        wal = os.stat(str(db_path) + "-wal")
+        if wal.st_size:
+            mtime = max(mtime, wal.st_mtime)
+    except OSError:
+        pass
+    return mtime
+
+def startup_backup_db_to_app_dir(con=None) -> Optional[Path]:
     """
     Sauvegarde la DB au démarrage dans le dossier d’exécution (EXE/.py).
-    - Crée: history_startup_YYYYmmdd_HHMMSS.db
-    - Met à jour: history_startup_latest.db
+    - Crée: history_startup_YYYYmmdd_HHMMSS.db (API de sauvegarde SQLite, copie cohérente sans verrou de fichier)
+    - Met à jour: history_startup_latest.db (lien physique vers la sauvegarde, copie en repli)
+    - Rien à faire si la DB n'a pas changé depuis la sauvegarde la plus récente
     - Rétention: ne garde que les STARTUP_BACKUP_KEEP_LAST plus récents
-    Retourne le chemin de la sauvegarde créée, ou None en cas d’échec non bloquant.
+    con : connexion ouverte à réutiliser (sinon une connexion temporaire est ouverte).
+    Retourne le chemin de la sauvegarde créée, ou None (rien à faire / échec non bloquant).
     """
     try:
         if not DB_PATH.exists():
             return None
         app_dir = _app_dir()
         app_dir.mkdir(parents=True, exist_ok=True)
+        latest_name = "history_startup_latest.db"
+        latest_path = app_dir / latest_name
+
+        # Un seul parcours du dossier (scandir : le stat est fourni avec l'entrée sous Windows)
+        backups = []
+        with os.scandir(app_dir) as it:
+            for e in it:
+                if e.name.startswith("history_startup_") and e.name.endswith(".db") and e.name != latest_name:
+                    try:
+                        backups.append((e.stat().st_mtime, e.path))
+                    except OSError:
+                        pass
+        backups.sort(reverse=True)
+        if backups and backups[0][0] >= _db_last_change(DB_PATH):
+            return None  # DB inchangée depuis la dernière sauvegarde
 
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_name = f"history_startup_{ts}.db"
-        backup_path = app_dir / backup_name
-        latest_path = app_dir / "history_startup_latest.db"
+        backup_path = app_dir / f"history_startup_{ts}.db"
+
+        src = con if con is not None else sqlite3.connect(DB_PATH)
+        try:
+            dst = sqlite3.connect(backup_path)
+            try:
+                src.backup(dst)
+            finally:
+                dst.close()
+        finally:
+            if src is not con:
+                src.close()
 
-        shutil.copy2(DB_PATH, backup_path)
         try:
-            if latest_path.exists():
-                try:
-                    latest_path.unlink()
-                except Exception:
-                    pass
-            shutil.copy2(backup_path, latest_path)
+            tmp = app_dir / (latest_name + ".tmp")
+            if tmp.exists():
+                tmp.unlink()
+            try:
+                os.link(backup_path, tmp)        # pas de deuxième écriture des octets
+            except OSError:
+                shutil.copy2(backup_path, tmp)   # FS sans liens physiques
+            os.replace(tmp, latest_path)
         except Exception:
             pass  # alias non bloquant
 
         if STARTUP_BACKUP_KEEP_LAST and STARTUP_BACKUP_KEEP_LAST > 0:
-            try:
-                backups = sorted(
-                    app_dir.glob("history_startup_*.db"),
-                    key=lambda p: p.stat().st_mtime,
-                    reverse=True
-                )
-                for old in backups[STARTUP_BACKUP_KEEP_LAST:]:
-                    try: old.unlink()
-                    except Exception: pass
-            except Exception:
-                pass
+            for _, old in backups[STARTUP_BACKUP_KEEP_LAST - 1:]:
+                try: os.remove(old)
+                except Exception: pass
 
         return backup_path
     except Exception:
@@ -146,8 +180,17 @@ def startup_backup_db_to_app_dir() -> Optional[Path]:
 def ensure_db():
     """Crée la DB et **assure** la présence des colonnes (migration douce)."""
     DB_DIR.mkdir(parents=True, exist_ok=True)
-    con = sqlite3.connect(DB_PATH)
+    # isolation_level=None : pas de transaction implicite, les écritures groupées font BEGIN/COMMIT
+    con = sqlite3.connect(DB_PATH, isolation_level=None)
+    # lower() de SQLite (et LIKE) ne replie la casse que sur l'ASCII : 'É' doit trouver 'é'
+    con.create_function("PYLOWER", 1, lambda v: v.lower() if v else "", deterministic=True)
     cur = con.cursor()
+    cur.execute("PRAGMA page_size=4096")       # effectif seulement sur une base neuve (avant le passage en WAL)
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute("PRAGMA synchronous=NORMAL")
+    cur.execute("PRAGMA cache_size=-20000")    # ~20 Mo
+    cur.execute("PRAGMA mmap_size=268435456")  # 256 Mo
+    cur.execute("PRAGMA temp_store=MEMORY")
     cur.execute("""
         CREATE TABLE IF NOT EXISTS items (
             id INTEGER PRIMARY KEY,
@@ -155,7 +198,8 @@ def ensure_db():
             display_name TEXT,
             source TEXT,
             opened_at TEXT,
-            exists_now INTEGER
+            exists_now INTEGER,
+            opened_at_ts INTEGER
         )
     """)
     # Migration: vérifier colonnes
@@ -172,52 +216,145 @@ def ensure_db():
         cur.execute("ALTER TABLE items ADD COLUMN opened_at TEXT"); changed = True
     if "exists_now" not in cols:
         cur.execute("ALTER TABLE items ADD COLUMN exists_now INTEGER"); changed = True
+    if "opened_at_ts" not in cols:
+        cur.execute("ALTER TABLE items ADD COLUMN opened_at_ts INTEGER"); changed = True
     if changed:
         con.commit()
+    # opened_at_ts = opened_at (heure locale ISO) en secondes Unix : tri/plages sur un entier indexé.
+    # Le texte reste stocké : il fait partie de la clé d'upsert et sert à l'affichage.
+    # Index couvrant de la requête du tableau/export (tri sur opened_at_ts, colonnes affichées) :
+    # la page se lit sans revenir à la table. Remplace l'index simple idx_items_ts (même préfixe).
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS idx_items_cover
+        ON items(opened_at_ts DESC, opened_at, display_name, source, exists_now)
+    """)
+    cur.execute("DROP INDEX IF EXISTS idx_items_ts")
+    cur.execute("""
+        UPDATE items SET opened_at_ts = CAST(strftime('%s', opened_at, 'utc') AS INTEGER)
+        WHERE opened_at_ts IS NULL AND opened_at IS NOT NULL
+    """)  # lignes anciennes ou écrites par une version précédente ; via idx_items_cover, quasi gratuit sinon
+    # Gardé (et non supprimé) : V19, V28 et les autres versions sur la même base le recréeraient à chaque lancement
     cur.execute("CREATE INDEX IF NOT EXISTS idx_items_opened_at ON items(opened_at)")
-    cur.execute("CREATE INDEX IF NOT EXISTS idx_items_target ON items(target_path)")
+    # Clé d'upsert (target_path, opened_at).
+    # Même nom que V19 : les versions qui partagent history.db ne créent qu'un seul index UNIQUE.
+    cur.execute("SELECT 1 FROM sqlite_master WHERE type='index' AND name='idx_items_target_opened'")
+    if cur.fetchone() is None:
+        cur.execute("""
+            DELETE FROM items WHERE id NOT IN (
+                SELECT MIN(id) FROM items GROUP BY target_path, opened_at
+            )
+        """)
+        cur.execute("CREATE UNIQUE INDEX idx_items_target_opened ON items(target_path, opened_at)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_items_target ON items(target_path)")  # créé aussi par V13-V27
+    cur.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER)")
     con.commit()
+    cur.execute("PRAGMA optimize")
     return con
 
-def upsert_item(con, target_path: str, display_name: str, source: str, opened_at: datetime) -> bool:
-    """Ajoute si nouveau (target_path, opened_at), sinon met à jour. Retourne True si INSERT."""
+def _meta_get(con, key: str, default: int = 0) -> int:
+    row = con.execute("SELECT value FROM meta WHERE key=?", (key,)).fetchone()
+    return row[0] if row and row[0] is not None else default
+
+def _meta_set(con, key: str, value: int):
+    con.execute("INSERT INTO meta(key, value) VALUES(?,?) ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+                (key, value))
+
+def _note_inserts(con, count: int):
+    """Cumule les insertions depuis le dernier ANALYZE ; relance ANALYZE items au-delà du seuil."""
+    pending = _meta_get(con, "inserts_since_analyze") + count
+    if pending >= ANALYZE_AFTER_INSERTS:
+        con.execute("ANALYZE items")
+        pending = 0
+    _meta_set(con, "inserts_since_analyze", pending)
+
+def maintain_db(con):
+    """
+    Entretien au démarrage (non bloquant) : VACUUM si la base contient plus de VACUUM_FREE_RATIO
+    de pages libres, au plus une fois tous les VACUUM_MIN_INTERVAL_DAYS jours.
+    """
+    try:
+        page_count = con.execute("PRAGMA page_count").fetchone()[0]
+        freelist = con.execute("PRAGMA freelist_count").fetchone()[0]
+        if not page_count or freelist <= page_count * VACUUM_FREE_RATIO:
+            return
+        now = int(datetime.now().timestamp())
+        if now - _meta_get(con, "last_vacuum") < VACUUM_MIN_INTERVAL_DAYS * 86400:
+            return
+        con.execute("VACUUM")
+        _meta_set(con, "last_vacuum", now)
+    except Exception:
+        pass
+
+def close_db(con):
+    """Ferme la connexion après un PRAGMA optimize (statistiques du planificateur à jour)."""
+    try:
+        con.execute("PRAGMA optimize")
+    except Exception:
+        pass
+    finally:
+        con.close()
+
+_SQL_UPSERT = """
+    INSERT INTO items(target_path, display_name, source, opened_at, opened_at_ts, exists_now)
+    VALUES(?,?,?,?,?,?)
+    ON CONFLICT(target_path, opened_at) DO UPDATE SET
+      display_name=excluded.display_name,
+      source=excluded.source,
+      exists_now=excluded.exists_now
+"""
+
+def upsert_items(con, rows: List[Tuple[str, str, str, str, Optional[int], int]]) -> List[Tuple[str, str]]:
+    """
+    Ajoute si nouveau (target_path, opened_at), sinon met à jour ; une seule transaction.
+    rows = [(target_path, display_name, source, opened_at_iso, opened_at_ts, exists_now)]
+    Retourne [(display_name, opened_at_iso)] des lignes insérées (id au-delà du MAX(id) d'avant).
+    """
     cur = con.cursor()
-    cur.execute("SELECT id FROM items WHERE target_path=? AND opened_at=?", (target_path, opened_at.isoformat()))
-    row = cur.fetchone()
-    exists_now = 1 if (target_path and Path(target_path).exists()) else 0
-    if row:
-        cur.execute("UPDATE items SET display_name=?, source=?, exists_now=? WHERE id=?",
-                    (display_name, source, exists_now, row[0]))
-        con.commit()
-        return False
-    else:
-        cur.execute("""INSERT INTO items(target_path, display_name, source, opened_at, exists_now)
-                       VALUES(?,?,?,?,?)""",
-                    (target_path, display_name, source, opened_at.isoformat(), exists_now))
-        con.commit()
-        return True
+    # IMMEDIATE : verrou d'écriture pris avant de lire MAX(id), pour qu'un autre écrivain (tâche planifiée,
+    # autre version) ne puisse pas insérer entre cette lecture et celle des lignes ajoutées
+    cur.execute("BEGIN IMMEDIATE")
+    try:
+        cur.execute("SELECT COALESCE(MAX(id), 0) FROM items")
+        last_id = cur.fetchone()[0]
+        cur.executemany(_SQL_UPSERT, rows)
+        cur.execute("SELECT display_name, opened_at FROM items WHERE id > ? ORDER BY id", (last_id,))
+        added = cur.fetchall()
+        cur.execute("COMMIT")
+    except Exception:
+        cur.execute("ROLLBACK")
+        raise
+    if added:
+        _note_inserts(con, len(added))
+    return added
 
 # ===================== SCAN =====================
 def scan_recent(con) -> Tuple[int, List[Tuple[str, str]]]:
-    """Parcourt 'Recent' et ajoute les entrées dans la DB. Retourne (nb_lus, [(display_name, opened_at_iso)] insérés)."""
+    """
+    Parcourt 'Recent' et ajoute les entrées dans la DB. Retourne (nb_lus, [(display_name, opened_at_iso)] insérés).
+    Ajout si nouveau (target_path, opened_at), sinon mise à jour ; tout est écrit en une seule transaction.
+    """
     if not RECENT_DIR.exists():
         return 0, []
-    count = 0
-    added: List[Tuple[str, str]] = []
-    for lnk in RECENT_DIR.glob("*.lnk"):
-        opened_at = file_mtime_dt(lnk)
-        display = lnk.stem
-        # On garde target_path vide (UI n’en a pas besoin), mais on maintient la colonne en DB.
-        target_path = ""
-        inserted = upsert_item(con, target_path, display, "Recent(.lnk)", opened_at)
-        count += 1
-        if inserted:
-            added.append((display, opened_at.isoformat()))
-    return count, added
+    rows = []
+    with os.scandir(RECENT_DIR) as it:
+        for entry in it:
+            if not entry.name.lower().endswith(".lnk") or not entry.is_file(follow_symlinks=False):
+                continue
+            try:
+                mtime = entry.stat().st_mtime
+                opened_at, opened_at_ts = datetime.fromtimestamp(mtime).isoformat(), int(mtime)
+            except (OSError, ValueError):
+                opened_at, opened_at_ts = datetime.min.isoformat(), None
+            # On garde target_path vide (UI n’en a pas besoin), mais on maintient la colonne en DB :
+            # sans cible, exists_now vaut toujours 0.
+            rows.append(("", entry.name[:-4], "Recent(.lnk)", opened_at, opened_at_ts, 0))
+    return len(rows), upsert_items(con, rows)
 
 # ===================== TACHE PLANIFIEE =====================
+_NORM_DROP_RE = re.compile(r"[\W_]+")  # tout sauf lettres/chiffres (Unicode), filtré en C
+
 def _norm_name(s: str) -> str:
-    return "".join(ch.lower() for ch in s if ch.isalnum())
+    return _NORM_DROP_RE.sub("", s.lower())
 
 def _preferred_exe_for_this_script() -> Optional[Path]:
     """Tente de trouver l'EXE qui correspond au nom du script (même dossier puis ./dist/)."""
@@ -236,6 +373,40 @@ def _preferred_exe_for_this_script() -> Optional[Path]:
                 return exe
     return None
 
+CREATE_NO_WINDOW = getattr(subprocess, "CREATE_NO_WINDOW", 0x08000000)  # pas de console qui clignote
+
+def _schtasks(*args) -> subprocess.CompletedProcess:
+    return subprocess.run(["schtasks", *args], capture_output=True, creationflags=CREATE_NO_WINDOW)
+
+def _decode_console(data: bytes) -> str:
+    if data[:2] in (b"\xff\xfe", b"\xfe\xff"):
+        return data.decode("utf-16", "replace")
+    try:
+        return data.decode("oem", "replace")
+    except LookupError:  # hors Windows
+        return data.decode("utf-8", "replace")
+
+def _task_already_configured(run_target: Path) -> bool:
+    """La tâche existe-t-elle déjà avec la même commande et les mêmes arguments ? (schtasks /Query /XML)"""
+    try:
+        res = _schtasks("/Query", "/TN", TASK_NAME, "/XML")
+    except Exception:
+        return False
+    if res.returncode != 0:
+        return False
+    try:
+        root = ET.fromstring(_decode_console(res.stdout))
+    except ET.ParseError:
+        return False
+    # /TR "\"exe\" --weekly-scan" : schtasks peut garder les guillemets autour de <Command>
+    wanted = os.path.normcase(str(run_target))
+    for action in root.iterfind(".//{*}Exec"):
+        command = (action.findtext("{*}Command") or "").strip().strip('"')
+        arguments = (action.findtext("{*}Arguments") or "").strip()
+        if os.path.normcase(command) == wanted and arguments == "--weekly-scan":
+            return True
+    return False
+
 def create_weekly_task():
     """Crée la tâche planifiée hebdomadaire (lundi 09:00). Priorité à l'EXE correspondant, sinon repli .py."""
     if getattr(sys, "frozen", False) and str(sys.executable).lower().endswith(".exe"):
@@ -243,26 +414,32 @@ def create_weekly_task():
     else:
         run_target = _preferred_exe_for_this_script() or Path(__file__).resolve()
     tr_cmd = f'"{run_target}" --weekly-scan'
+    if _task_already_configured(run_target):
+        return True, f"Tâche planifiée déjà configurée : {TASK_NAME}\n{tr_cmd}"
     try:
-        subprocess.run([
-            "schtasks", "/Create", "/TN", TASK_NAME, "/F",
+        res = _schtasks(
+            "/Create", "/TN", TASK_NAME, "/F",
             "/SC", "WEEKLY", "/D", "MON", "/ST", "09:00",
             "/RL", "LIMITED", "/TR", tr_cmd
-        ], check=True)
+        )
+        if res.returncode != 0:
+            detail = _decode_console(res.stderr or res.stdout).strip()
+            return False, f"Erreur schtasks (code {res.returncode}).\n{detail}".rstrip()
         return True, f"Tâche planifiée créée/MAJ : {TASK_NAME}\n{tr_cmd}"
-    except subprocess.CalledProcessError as e:
-        return False, f"Erreur schtasks (code {e.returncode})."
     except Exception as e:
         return False, f"Erreur création tâche : {e}"
 
 def run_weekly_scan_once():
     """Scan silencieux + log dans le dossier de l'exe/.py (PAS de backup ici : backup fait au démarrage)."""
     con = ensure_db()
-    count, added = scan_recent(con)
+    try:
+        count, added = scan_recent(con)
+    finally:
+        close_db(con)
 
     log_path = _app_dir() / "autoscan.log"
     ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    added_sorted = sorted(added, key=lambda t: t[1], reverse=True)[:50]
+    added_sorted = heapq.nlargest(50, added, key=lambda t: t[1])
     try:
         with open(log_path, "a", encoding="utf-8") as f:
             f.write(f"\n[{ts}] Autoscan: {count} .lnk parcourus, {len(added)} insertion(s).\n")
@@ -291,6 +468,12 @@ class App(tk.Tk):
         self.geometry("950x620")
         self.minsize(820, 540)
         self.con = ensure_db()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        # Pagination du tableau : filtre courant, nb de lignes chargées, reste-t-il des lignes
+        self._filter = ""
+        self._offset = 0
+        self._has_more = False
+        self._page_pending = False
 
         # --- Barre haut ---
         top = ttk.Frame(self)
@@ -301,7 +484,8 @@ class App(tk.Tk):
         ent.pack(side="left", padx=6)
         ent.bind("<Return>", lambda e: self.refresh_table())
         ttk.Button(top, text="Appliquer filtres", command=self.refresh_table).pack(side="left", padx=8)
-        ttk.Button(top, text="Scanner maintenant", command=self.scan_now).pack(side="left", padx=8)
+        self._scan_btn = ttk.Button(top, text="Scanner maintenant", command=self.scan_now)
+        self._scan_btn.pack(side="left", padx=8)
         ttk.Button(top, text="Exporter CSV", command=self.export_csv).pack(side="left", padx=8)
 
         # --- Tableau (sans la colonne chemin) ---
@@ -309,9 +493,9 @@ class App(tk.Tk):
         frame.rowconfigure(0, weight=1); frame.columnconfigure(0, weight=1)
         cols = ("opened_at", "display_name", "source", "exists_now")
         self.tree = ttk.Treeview(frame, columns=cols, show="headings")
-        yscroll = ttk.Scrollbar(frame, orient="vertical", command=self.tree.yview)
+        yscroll = self._yscroll = ttk.Scrollbar(frame, orient="vertical", command=self.tree.yview)
         xscroll = ttk.Scrollbar(frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=yscroll.set, xscrollcommand=xscroll.set)
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll, xscrollcommand=xscroll.set)
         self.tree.heading("opened_at", text="Date d'ouverture")
         self.tree.heading("display_name", text="Nom")
         self.tree.heading("source", text="Source")
@@ -335,34 +519,116 @@ class App(tk.Tk):
         ttk.Button(bottom, text="Sauvegarder la base", command=self.backup_db).pack(side="right")
 
         self.status_var = tk.StringVar()
-        ttk.Label(self, textvariable=self.status_var, anchor="w").pack(fill="x", padx=10, pady=(0,6))
+        status = ttk.Frame(self); status.pack(fill="x", padx=10, pady=(0,6))
+        ttk.Label(status, textvariable=self.status_var, anchor="w").pack(side="left", fill="x", expand=True)
+        self._scan_progress = ttk.Progressbar(status, mode="indeterminate", length=160)  # visible pendant un scan
 
         self.refresh_table()
 
     # ---- Data ----
-    def query_rows(self):
+    def query_rows(self, q: str = "", limit: int = -1, offset: int = 0):
+        """
+        Lignes de l'historique, déjà formatées pour le tableau par SQLite (date lisible, Oui/Non).
+        q = sous-chaîne recherchée dans le nom (filtrée par SQLite, sans casse, accents compris : PYLOWER).
+        limit/offset : pagination (-1 = pas de limite).
+        """
+        cur = self.con.cursor()
+        if not q:
+            cur.execute("""
+                SELECT replace(substr(COALESCE(opened_at, ''), 1, 19), 'T', ' '),
+                       display_name, source,
+                       CASE WHEN exists_now THEN 'Oui' ELSE 'Non' END
+                FROM items
+                ORDER BY opened_at_ts DESC
+                LIMIT ? OFFSET ?
+            """, (limit, offset))
+        else:
+            cur.execute("""
+                SELECT replace(substr(COALESCE(opened_at, ''), 1, 19), 'T', ' '),
+                       display_name, source,
+                       CASE WHEN exists_now THEN 'Oui' ELSE 'Non' END
+                FROM items
+                WHERE instr(PYLOWER(display_name), ?) > 0
+                ORDER BY opened_at_ts DESC
+                LIMIT ? OFFSET ?
+            """, (q.lower(), limit, offset))
+        return cur.fetchall()
+
+    def stream_rows(self):
+        """Lignes prêtes pour le CSV (exists en 1/0), par lots de 1000 via fetchmany : mémoire constante."""
         cur = self.con.cursor()
+        cur.arraysize = 1000
         cur.execute("""
-            SELECT opened_at, display_name, source, exists_now
+            SELECT opened_at, display_name, source, CASE WHEN exists_now THEN '1' ELSE '0' END
             FROM items
-            ORDER BY datetime(opened_at) DESC
+            ORDER BY opened_at_ts DESC
         """)
-        return cur.fetchall()
+        while True:
+            rows = cur.fetchmany()
+            if not rows:
+                break
+            yield from rows
 
     def refresh_table(self):
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-        q = self.search_var.get().lower().strip()
-        for opened_at, name, source, exists_now in self.query_rows():
-            if q and q not in (name or "").lower():
-                continue
-            exists_label = "Oui" if exists_now else "Non"
-            opened_at_disp = (opened_at or "").replace("T", " ")[:19]
-            self.tree.insert("", "end", values=(opened_at_disp, name, source, exists_label))
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self._filter = self.search_var.get().strip()
+        self._offset = 0
+        self._load_next_page()
+
+    def _load_next_page(self):
+        """Ajoute au tableau les PAGE_SIZE lignes suivantes du filtre courant."""
+        rows = self.query_rows(self._filter, PAGE_SIZE, self._offset)
+        self._offset += len(rows)
+        self._has_more = len(rows) == PAGE_SIZE
+        insert = self.tree.insert
+        for row in rows:
+            insert("", "end", values=row)
+
+    def _on_tree_yscroll(self, first, last):
+        """yscrollcommand du tableau : suit la barre et charge la page suivante à l'approche du bas."""
+        self._yscroll.set(first, last)
+        if self._has_more and not self._page_pending and float(last) > 0.9:
+            self._page_pending = True
+            self.after_idle(self._load_page_when_idle)
+
+    def _load_page_when_idle(self):
+        self._page_pending = False
+        if self._has_more:
+            self._load_next_page()
 
     # ---- Actions UI ----
     def scan_now(self):
-        count, _ = scan_recent(self.con)
+        """Lance le scan dans un thread : l'interface reste utilisable (WAL : lectures pendant l'écriture)."""
+        self._scan_btn.config(state="disabled")
+        self.status_var.set("Scan en cours…")
+        self._scan_progress.pack(side="right")
+        self._scan_progress.start(15)
+        threading.Thread(target=self._scan_worker, daemon=True).start()
+
+    def _scan_worker(self):
+        # Connexion dédiée : un objet sqlite3.Connection ne se partage pas entre threads
+        try:
+            con = ensure_db()
+            try:
+                count, _ = scan_recent(con)
+            finally:
+                close_db(con)
+        except Exception as e:
+            self.after(0, self._scan_done, None, e)
+        else:
+            self.after(0, self._scan_done, count, None)
+
+    def _scan_done(self, count, error):
+        """Retour dans le thread Tk : arrête la barre, rafraîchit le tableau et réactive le bouton."""
+        self._scan_progress.stop()
+        self._scan_progress.pack_forget()
+        self._scan_btn.config(state="normal")
+        self.status_var.set("")
+        if error is not None:
+            messagebox.showerror(APP_NAME, f"Échec du scan :\n{error}")
+            return
         self.refresh_table()
         messagebox.showinfo(APP_NAME, f"Scan terminé : {count} éléments parcourus.")
 
@@ -391,6 +657,10 @@ class App(tk.Tk):
         self.clipboard_clear(); self.clipboard_append(name); self.update()
         self._flash_status(f'Nom copié : "{name}"')
 
+    def _on_close(self):
+        close_db(self.con)
+        self.destroy()
+
     def _flash_status(self, msg: str, delay_ms: int = 2000):
         self.status_var.set(msg)
         self.after(delay_ms, lambda: self.status_var.set(""))
@@ -422,12 +692,10 @@ class App(tk.Tk):
             filetypes=[("CSV", "*.csv"), ("Tous les fichiers", "*.*")]
         )
         if not path: return
-        rows = self.query_rows()
         with open(path, "w", newline="", encoding="utf-8") as f:
             w = csv.writer(f, delimiter=";")
             w.writerow(["opened_at", "name", "source", "exists"])
-            for opened_at, name, source, exists_now in rows:
-                w.writerow([opened_at, name, source, "1" if exists_now else "0"])
+            w.writerows(self.stream_rows())
         messagebox.showinfo(APP_NAME, f"Exporté : {path}")
 
     def backup_db(self):
@@ -442,7 +710,12 @@ class App(tk.Tk):
         if not path:
             return
         try:
-            shutil.copy2(DB_PATH, path)
+            # API de sauvegarde SQLite : inclut les transactions encore dans history.db-wal
+            dst = sqlite3.connect(path)
+            try:
+                self.con.backup(dst)
+            finally:
+                dst.close()
             messagebox.showinfo(APP_NAME, f"Base sauvegardée avec succès :\n{path}")
         except Exception as e:
             messagebox.showerror(APP_NAME, f"Erreur lors de la sauvegarde :\n{e}")
@@ -464,7 +737,8 @@ if __name__ == "__main__":
 
     # 2) SAUVEGARDE AUTOMATIQUE AU DÉMARRAGE (GUI ou weekly-scan)
     #    (échec silencieux si non inscriptible)
-    startup_backup_db_to_app_dir()
+    startup_backup_db_to_app_dir(con)
+    maintain_db(con)  # après la sauvegarde : VACUUM occasionnel
 
     # 3) Mode planifié ?
     if "--weekly-scan" in sys.argv:
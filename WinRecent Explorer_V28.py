@@ -20,17 +20,16 @@ import csv
 import shutil
 import sqlite3
 import subprocess
+import threading
 import ctypes
 import ctypes.wintypes as wt
 import re
 import fnmatch
+import functools
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, List, Tuple
 
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-
 # ===================== CONFIG =====================
 APP_NAME = "WinRecent Explorer"
 APP_VERSION = "v0.14"
@@ -42,58 +41,18 @@ RECENT_DIR = Path(os.environ.get("APPDATA", "")) / "Microsoft" / "Windows" / "Re
 DB_DIR = Path(os.environ.get("LOCALAPPDATA", "")) / "RecentHistory"
 DB_PATH = DB_DIR / "history.db"
 
-# ===================== COM / ShellLink (réservé si besoin plus tard) =====================
-if not hasattr(wt, "GUID"):
-    class GUID(ctypes.Structure):
-        _fields_ = [
-            ("Data1", ctypes.c_ulong),
-            ("Data2", ctypes.c_ushort),
-            ("Data3", ctypes.c_ushort),
-            ("Data4", ctypes.c_ubyte * 8),
-        ]
-        def __init__(self, guid_str):
-            import uuid
-            u = uuid.UUID(guid_str)
-            super().__init__()
-            self.Data1 = u.time_low
-            self.Data2 = u.time_mid
-            self.Data3 = u.time_hi_version
-            for i, b in enumerate(u.bytes[8:]):
-                self.Data4[i] = b
-    wt.GUID = GUID
-
-if not hasattr(wt, "HRESULT"):
-    class HRESULT(ctypes.c_long):
-        pass
-    wt.HRESULT = HRESULT
-
-if not hasattr(wt, "LPCOLESTR"):
-    wt.LPCOLESTR = wt.LPWSTR
-
-CLSID_ShellLink = wt.GUID("{00021401-0000-0000-C000-000000000046}")
-IID_IShellLinkW = wt.GUID("{000214F9-0000-0000-C000-000000000046}")
-IID_IPersistFile = wt.GUID("{0000010b-0000-0000-C000-000000000046}")
-
-class IShellLinkW(ctypes.Structure):
-    pass
-
-class IPersistFile(ctypes.Structure):
-    pass
-
-LPIShellLinkW = ctypes.POINTER(IShellLinkW)
-LPIPersistFile = ctypes.POINTER(IPersistFile)
-
-ole32 = ctypes.OleDLL("ole32")
-CoInitialize = ole32.CoInitialize
-CoUninitialize = ole32.CoUninitialize
+# ===================== Copie de fichiers (Win32) =====================
+kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+_CopyFileW = kernel32.CopyFileW
+_CopyFileW.argtypes = [wt.LPCWSTR, wt.LPCWSTR, wt.BOOL]
+_CopyFileW.restype = wt.BOOL
 
-# ===================== UTIL =====================
-def file_mtime_dt(path: Path) -> datetime:
-    try:
-        return datetime.fromtimestamp(path.stat().st_mtime)
-    except Exception:
-        return datetime.min
+def copy_file(src: str, dst: str):
+    """Copie src -> dst (écrase) en un seul appel noyau ; dates et attributs conservés comme copy2."""
+    if not _CopyFileW(src, dst, False):
+        raise ctypes.WinError(ctypes.get_last_error())
 
+# ===================== UTIL =====================
 def _app_dir() -> Path:
     """Dossier du script .py ou de l'exe packagé."""
     try:
@@ -103,21 +62,39 @@ def _app_dir() -> Path:
     except Exception:
         return Path.cwd()
 
-def get_backup_dir() -> Path:
-    """
-    Dossier de sauvegarde des .lnk :
-    lnk_backup à côté du script/exe.
-    """
-    d = _app_dir() / "lnk_backup"
-    d.mkdir(parents=True, exist_ok=True)
-    return d
+# Calculés une fois au chargement (resolve() + mkdir ne sont plus refaits à chaque scan)
+_APP_DIR = _app_dir()
+BACKUP_DIR = _APP_DIR / "lnk_backup"  # sauvegarde des .lnk, à côté du script/exe
+try:
+    BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+except OSError:
+    pass  # dossier non inscriptible : les copies échoueront silencieusement, comme avant
 
 # ===================== DB =====================
+def _py_lower(value) -> str:
+    return value.lower() if value else ""
+
+def _fill_missing_lc(cur):
+    """Calcule *_lc des lignes écrites sans eux (autres versions du programme, ou marquées par le trigger)."""
+    cur.execute("""
+        UPDATE items SET display_name_lc = PYLOWER(display_name), source_lc = PYLOWER(source)
+        WHERE display_name_lc IS NULL OR source_lc IS NULL
+    """)
+
 def ensure_db():
     """Crée la DB et assure la présence de toutes les colonnes nécessaires."""
     DB_DIR.mkdir(parents=True, exist_ok=True)
     con = sqlite3.connect(DB_PATH)
+    # lower() de SQLite ne replie la casse que sur l'ASCII : str.lower pour les colonnes *_lc
+    con.create_function("PYLOWER", 1, _py_lower, deterministic=True)
     cur = con.cursor()
+    # WAL : un COMMIT = un ajout au journal, sans la double synchronisation du journal « rollback »
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute("PRAGMA synchronous=NORMAL")
+    cur.execute("PRAGMA temp_store=MEMORY")
+    cur.execute("PRAGMA busy_timeout=5000")    # scan en arrière-plan + GUI : attendre le verrou plutôt qu'échouer
+    cur.execute("PRAGMA mmap_size=268435456")  # 256 Mo : lectures via le cache de pages de l'OS
+    cur.execute("PRAGMA cache_size=-20000")    # ~20 Mo de cache de pages (défaut ~2 Mo) pour le tableau et l'export
     cur.execute("""
         CREATE TABLE IF NOT EXISTS items (
             id INTEGER PRIMARY KEY,
@@ -141,64 +118,125 @@ def ensure_db():
         cur.execute("ALTER TABLE items ADD COLUMN opened_at TEXT"); changed = True
     if "exists_now" not in cols:
         cur.execute("ALTER TABLE items ADD COLUMN exists_now INTEGER"); changed = True
+    # Nom / source en minuscules (str.lower, Unicode) pour la recherche SQL
+    if "display_name_lc" not in cols:
+        cur.execute("ALTER TABLE items ADD COLUMN display_name_lc TEXT"); changed = True
+    if "source_lc" not in cols:
+        cur.execute("ALTER TABLE items ADD COLUMN source_lc TEXT"); changed = True
     if changed:
         con.commit()
+    # Les autres versions (V19, V24…) partagent history.db sans connaître *_lc : un renommage de leur part
+    # remet *_lc à NULL (le trigger n'utilise que du SQL standard), et _fill_missing_lc complète.
+    cur.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_items_lc_stale
+        AFTER UPDATE OF display_name, source ON items
+        WHEN (NEW.display_name IS NOT OLD.display_name OR NEW.source IS NOT OLD.source)
+         AND NEW.display_name_lc IS OLD.display_name_lc AND NEW.source_lc IS OLD.source_lc
+        BEGIN
+            UPDATE items SET display_name_lc = NULL, source_lc = NULL WHERE id = NEW.id;
+        END
+    """)
+    _fill_missing_lc(cur)
+    # Sert les ORDER BY opened_at DESC (parcours à l'envers) : pas besoin d'un index DESC en double.
     cur.execute("CREATE INDEX IF NOT EXISTS idx_items_opened_at ON items(opened_at)")
-    cur.execute("CREATE INDEX IF NOT EXISTS idx_items_target ON items(target_path)")
+    # Clé d'upsert (target_path, opened_at).
+    # Même nom que V19/V24 : les versions qui partagent history.db ne créent qu'un seul index UNIQUE.
+    cur.execute("SELECT 1 FROM sqlite_master WHERE type='index' AND name='idx_items_target_opened'")
+    if cur.fetchone() is None:
+        cur.execute("""
+            DELETE FROM items WHERE id NOT IN (
+                SELECT MIN(id) FROM items GROUP BY target_path, opened_at
+            )
+        """)
+        cur.execute("CREATE UNIQUE INDEX idx_items_target_opened ON items(target_path, opened_at)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_items_target ON items(target_path)")  # créé aussi par V13-V27
+    cur.execute("DROP INDEX IF EXISTS idx_items_display_name")  # la recherche passe par *_lc
     con.commit()
     return con
 
-def upsert_item(con, target_path: str, display_name: str, source: str, opened_at: datetime) -> bool:
-    """Ajoute si nouveau (target_path, opened_at), sinon met à jour. Retourne True si INSERT."""
+_SQL_UPSERT = """
+    INSERT INTO items(target_path, display_name, source, opened_at, exists_now, display_name_lc, source_lc)
+    VALUES(?,?,?,?,?,?,?)
+    ON CONFLICT(target_path, opened_at) DO UPDATE SET
+      display_name=excluded.display_name,
+      source=excluded.source,
+      exists_now=excluded.exists_now,
+      display_name_lc=excluded.display_name_lc,
+      source_lc=excluded.source_lc
+"""
+
+def upsert_items(con, rows: List[Tuple[str, str, str, str, int, str, str]]) -> List[Tuple[str, str]]:
+    """
+    Ajoute si nouveau (target_path, opened_at), sinon met à jour : un executemany dans une seule transaction.
+    rows = [(target_path, display_name, source, opened_at_iso, exists_now, display_name_lc, source_lc)]
+    Retourne [(display_name, opened_at_iso)] des lignes insérées (id au-delà du MAX(id) d'avant).
+    """
     cur = con.cursor()
-    cur.execute("SELECT id FROM items WHERE target_path=? AND opened_at=?", (target_path, opened_at.isoformat()))
-    row = cur.fetchone()
-    exists_now = 1 if (target_path and Path(target_path).exists()) else 0
-    if row:
-        cur.execute("UPDATE items SET display_name=?, source=?, exists_now=? WHERE id=?",
-                    (display_name, source, exists_now, row[0]))
-        con.commit()
-        return False
-    else:
-        cur.execute("""INSERT INTO items(target_path, display_name, source, opened_at, exists_now)
-                       VALUES(?,?,?,?,?)""",
-                    (target_path, display_name, source, opened_at.isoformat(), exists_now))
+    # Un seul COMMIT pour tout le lot. IMMEDIATE : verrou d'écriture pris avant de lire MAX(id), pour qu'un
+    # autre écrivain (tâche planifiée, autre version) ne puisse pas insérer entre les deux lectures
+    cur.execute("BEGIN IMMEDIATE")
+    try:
+        cur.execute("SELECT COALESCE(MAX(id), 0) FROM items")
+        last_id = cur.fetchone()[0]
+        cur.executemany(_SQL_UPSERT, rows)
+        _fill_missing_lc(cur)
+        cur.execute("SELECT display_name, opened_at FROM items WHERE id > ? ORDER BY id", (last_id,))
+        added = cur.fetchall()
         con.commit()
-        return True
+    except Exception:
+        con.rollback()
+        raise
+    return added
 
 # ===================== SCAN + BACKUP LNK =====================
 def scan_recent(con) -> Tuple[int, List[Tuple[str, str]]]:
     """
-    Parcourt 'Recent' et ajoute les entrées dans la DB.
+    Parcourt 'Recent' et ajoute les entrées dans la DB (une seule transaction).
     Sauvegarde chaque .lnk dans lnk_backup (à côté du script/exe).
     Retourne (nb_lus, [(display_name, opened_at_iso)] insérés).
     """
     if not RECENT_DIR.exists():
         return 0, []
-    count = 0
-    added: List[Tuple[str, str]] = []
-    backup_dir = get_backup_dir()
-
-    for lnk in RECENT_DIR.glob("*.lnk"):
-        opened_at = file_mtime_dt(lnk)
-        display = lnk.stem
-        target_path = ""  # conservé pour compat
-
-        # Sauvegarde du .lnk dans lnk_backup
-        try:
-            shutil.copy2(lnk, backup_dir / lnk.name)
-        except Exception:
-            pass
-
-        inserted = upsert_item(con, target_path, display, "Recent(.lnk)", opened_at)
-        count += 1
-        if inserted:
-            added.append((display, opened_at.isoformat()))
-    return count, added
+    rows = []
+    backup_root = str(BACKUP_DIR)
+    fromtimestamp = datetime.fromtimestamp
+    # os.scandir : nom + stat en un seul parcours (stat mis en cache dans le DirEntry sous Windows)
+    with os.scandir(str(RECENT_DIR)) as it:
+        for entry in it:
+            name = entry.name
+            if not name.lower().endswith(".lnk") or not entry.is_file(follow_symlinks=False):
+                continue
+            try:
+                st = entry.stat()
+                opened_at_iso = fromtimestamp(st.st_mtime).isoformat()  # format de la clé en base
+            except (OSError, ValueError):
+                st, opened_at_iso = None, datetime.min.isoformat()
+            target_path = ""  # conservé pour compat
+            exists_now = 0     # sans cible résolue ; la colonne « Existe » est calculée à l'affichage (load_rows)
+
+            # Sauvegarde du .lnk dans lnk_backup, sauf si la copie est déjà à jour (même mtime + taille)
+            backup_path = os.path.join(backup_root, name)
+            try:
+                bst = os.stat(backup_path)
+                unchanged = st is not None and bst.st_mtime_ns == st.st_mtime_ns and bst.st_size == st.st_size
+            except OSError:
+                unchanged = False
+            if not unchanged:
+                try:
+                    copy_file(entry.path, backup_path)
+                except Exception:
+                    pass
+
+            display_name = name[:-4]
+            rows.append((target_path, display_name, "Recent(.lnk)", opened_at_iso, exists_now,
+                         display_name.lower(), "recent(.lnk)"))
+    return len(rows), upsert_items(con, rows)
 
 # ===================== TACHE PLANIFIEE =====================
+_NORM_RE = re.compile(r"[\W_]+")  # tout sauf lettres/chiffres (Unicode), filtré en C
+
 def _norm_name(s: str) -> str:
-    return "".join(ch.lower() for ch in s if ch.isalnum())
+    return _NORM_RE.sub("", s).lower()
 
 def _preferred_exe_for_this_script() -> Optional[Path]:
     """Tente de trouver l'EXE qui correspond au nom du script (même dossier puis ./dist/)."""
@@ -239,23 +277,28 @@ def create_weekly_task():
 def run_weekly_scan_once():
     """Scan silencieux et écriture d’un autoscan.log (50 dernières insertions de CE run) dans le dossier de l'exe/.py."""
     con = ensure_db()
-    count, added = scan_recent(con)
-    log_path = _app_dir() / "autoscan.log"
+    try:
+        count, added = scan_recent(con)
+    finally:
+        con.close()
+    # upsert_items renvoie déjà les lignes insérées par ce run : les 50 plus récentes, sans relire la base
+    latest = sorted(added, key=lambda r: r[1] or "", reverse=True)[:50]
+    log_path = _APP_DIR / "autoscan.log"
     ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    added_sorted = sorted(added, key=lambda t: t[1], reverse=True)[:50]
+    lines = [f"\n[{ts}] Autoscan: {count} .lnk parcourus, {len(added)} insertion(s).\n"]
+    if latest:
+        lines.append("Dernières insertions (Nom | Date d'ouverture):\n")
+        for name, opened_at_iso in latest:
+            try:
+                dt = datetime.fromisoformat(opened_at_iso).strftime("%Y-%m-%d %H:%M:%S")
+            except Exception:
+                dt = opened_at_iso
+            lines.append(f" - {name} | {dt}\n")
+    else:
+        lines.append("Aucune nouvelle entrée insérée.\n")
     try:
         with open(log_path, "a", encoding="utf-8") as f:
-            f.write(f"\n[{ts}] Autoscan: {count} .lnk parcourus, {len(added)} insertion(s).\n")
-            if added_sorted:
-                f.write("Dernières insertions (Nom | Date d'ouverture):\n")
-                for name, opened_at_iso in added_sorted:
-                    try:
-                        dt = datetime.fromisoformat(opened_at_iso).strftime("%Y-%m-%d %H:%M:%S")
-                    except Exception:
-                        dt = opened_at_iso
-                    f.write(f" - {name} | {dt}\n")
-            else:
-                f.write("Aucune nouvelle entrée insérée.\n")
+            f.write("".join(lines))  # une seule écriture
     except Exception:
         try:
             with open(DB_DIR / "autoscan_fallback.log", "a", encoding="utf-8") as f:
@@ -263,14 +306,99 @@ def run_weekly_scan_once():
         except Exception:
             pass
 
+# ===================== MODE PLANIFIÉ =====================
+# Traité avant l'import de tkinter : la tâche hebdomadaire ne charge pas Tcl/Tk.
+if __name__ == "__main__" and "--weekly-scan" in sys.argv:
+    run_weekly_scan_once()
+    sys.exit(0)
+
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+
+# ===================== RECHERCHE (SQL) =====================
+# Colonnes *_lc déjà en minuscules (Unicode) : motif mis en minuscules côté Python, comparaison simple côté SQLite
+_SQL_IDS_LIKE = "SELECT id FROM items WHERE display_name_lc LIKE ? ESCAPE '\\' OR source_lc LIKE ? ESCAPE '\\'"
+_SQL_IDS_GLOB = "SELECT id FROM items WHERE display_name_lc GLOB ? OR source_lc GLOB ?"
+_SQL_IDS_REMATCH = "SELECT id FROM items WHERE REMATCH(?, display_name, source)"
+
+def _fnmatch_to_glob(pat: str) -> str:
+    """
+    Motif fnmatch -> motif GLOB de SQLite, pour que SQL et prédicat Python trouvent les mêmes lignes :
+    négation [!x] -> [^x], '^' en tête de classe littéral chez fnmatch (déplacé en fin), '[' sans ']' -> [[].
+    """
+    out = []
+    i, n = 0, len(pat)
+    while i < n:
+        c = pat[i]
+        i += 1
+        if c != "[":
+            out.append(c)
+            continue
+        j = i  # même recherche du ']' fermant que fnmatch.translate
+        if j < n and pat[j] == "!":
+            j += 1
+        if j < n and pat[j] == "]":
+            j += 1
+        while j < n and pat[j] != "]":
+            j += 1
+        if j >= n:
+            out.append("[[]")  # '[' littéral
+            continue
+        stuff = pat[i:j]
+        i = j + 1
+        if stuff[0] == "!":
+            out.append("[^" + stuff[1:] + "]")
+        elif stuff[0] == "^":
+            out.append("^" if stuff == "^" else "[" + stuff[1:] + "^]")
+        else:
+            out.append("[" + stuff + "]")
+    return "".join(out)
+
+@functools.lru_cache(maxsize=64)
+def _compiled_regex(pattern: str):
+    return re.compile(pattern, re.IGNORECASE)
+
+def _sql_rematch(pattern, name, source) -> bool:
+    """REMATCH(motif, nom, source) pour SQLite : un seul rappel Python par ligne pour les deux colonnes."""
+    search = _compiled_regex(pattern).search
+    return search(name or "") is not None or search(source or "") is not None
+
+@functools.lru_cache(maxsize=64)
+def _make_predicate(raw: str):
+    """Prédicat (name, source) -> bool pour un texte de recherche non vide ; construit une fois par texte."""
+    # Regex entre /.../
+    if len(raw) >= 2 and raw.startswith("/") and raw.endswith("/"):
+        pattern = raw[1:-1]
+        try:
+            search = _compiled_regex(pattern).search
+            return lambda name, source: bool(search(name or "") or search(source or ""))
+        except re.error:
+            lowered = raw.lower()
+            return lambda name, source: (lowered in (name or "").lower() or
+                                         lowered in (source or "").lower())
+
+    # Jokers * ? : fnmatch.translate compilé une fois (IGNORECASE), puis match direct sans lower() par ligne
+    if "*" in raw or "?" in raw:
+        match = re.compile(fnmatch.translate(raw), re.IGNORECASE).match
+        return lambda name, source: bool(match(name or "") or match(source or ""))
+
+    # Substring classique
+    lowered = raw.lower()
+    return lambda name, source: (
+        lowered in (name or "").lower() or
+        lowered in (source or "").lower()
+    )
+
 # ===================== GUI =====================
 class App(tk.Tk):
-    def __init__(self):
+    def __init__(self, con: sqlite3.Connection):
         super().__init__()
         self.title(APP_NAME)
         self.geometry("950x620")
         self.minsize(820, 540)
-        self.con = ensure_db()
+        self.con = con  # connexion unique de l'interface (ouverte par main_gui)
+        self._cur = self.con.cursor()  # réutilisé par query_rows et la recherche SQL
+        self.con.create_function("REMATCH", 3, _sql_rematch, deterministic=True)
 
         # --- Barre haut ---
         top = ttk.Frame(self)
@@ -279,9 +407,13 @@ class App(tk.Tk):
         self.search_var = tk.StringVar()
         ent = ttk.Entry(top, textvariable=self.search_var, width=40)
         ent.pack(side="left", padx=6)
-        ent.bind("<Return>", lambda e: self.refresh_table())
-        ttk.Button(top, text="Appliquer filtres", command=self.refresh_table).pack(side="left", padx=8)
-        ttk.Button(top, text="Scanner maintenant", command=self.scan_now).pack(side="left", padx=8)
+        ent.bind("<Return>", lambda e: self._search_debounced())
+        # Recherche au fil de la frappe : une rafale de touches = un seul filtrage (200 ms après la dernière)
+        self._search_pending = None
+        self.search_var.trace_add("write", self._on_search_changed)
+        ttk.Button(top, text="Appliquer filtres", command=self._search_debounced).pack(side="left", padx=8)
+        self._scan_btn = ttk.Button(top, text="Scanner maintenant", command=self.scan_now)
+        self._scan_btn.pack(side="left", padx=8)
         ttk.Button(top, text="Exporter CSV", command=self.export_csv).pack(side="left", padx=8)
 
         # --- Tableau ---
@@ -291,10 +423,13 @@ class App(tk.Tk):
         frame.columnconfigure(0, weight=1)
 
         cols = ("opened_at", "display_name", "source", "exists_now")
-        self.tree = ttk.Treeview(frame, columns=cols, show="headings")
-        yscroll = ttk.Scrollbar(frame, orient="vertical", command=self.tree.yview)
+        # Liste virtuelle : le Treeview ne contient que les lignes visibles (pool fixe d'éléments Tk),
+        # la barre verticale pilote self._top (index de la première ligne affichée dans self._filtered).
+        self.tree = ttk.Treeview(frame, columns=cols, show="headings", selectmode="browse")
+        yscroll = ttk.Scrollbar(frame, orient="vertical", command=self._on_yscroll)
         xscroll = ttk.Scrollbar(frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=yscroll.set, xscrollcommand=xscroll.set)
+        self.tree.configure(xscrollcommand=xscroll.set)
+        self._yscroll = yscroll
 
         self.tree.heading("opened_at", text="Date d'ouverture")
         self.tree.heading("display_name", text="Nom")
@@ -322,6 +457,12 @@ class App(tk.Tk):
         self.tree.bind("<Double-1>", self._on_double_click_row)
         # Clic droit : menu contextuel
         self.tree.bind("<Button-3>", self._on_right_click)
+        # Liste virtuelle : défilement, clavier, sélection et redimensionnement passent par _render
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
+        self.tree.bind("<Configure>", lambda e: self._render())
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        for key in ("<Up>", "<Down>", "<Prior>", "<Next>", "<Home>", "<End>"):
+            self.tree.bind(key, self._on_key_nav)
 
         # --- Bas + statut ---
         bottom = ttk.Frame(self)
@@ -329,24 +470,61 @@ class App(tk.Tk):
         ttk.Button(bottom, text="Ouvrir (dans 'Recent')", command=self.open_file).pack(side="left")
         ttk.Button(bottom, text="Ouvrir la cible", command=self.open_target).pack(side="left", padx=8)
         ttk.Button(bottom, text="Activer la sauvegarde Auto", command=self.enable_autoscan).pack(side="left", padx=8)
-        ttk.Button(bottom, text="Sauvegarder la base", command=self.backup_db).pack(side="right")
+        self._backup_btn = ttk.Button(bottom, text="Sauvegarder la base", command=self.backup_db)
+        self._backup_btn.pack(side="right")
         ttk.Button(bottom, text="À propos", command=self.show_about).pack(side="right", padx=8)
 
         self.status_var = tk.StringVar()
         ttk.Label(self, textvariable=self.status_var, anchor="w").pack(fill="x", padx=10, pady=(0,6))
 
-        self.refresh_table()
+        self._rows: List[Tuple[str, str, str]] = []  # (iid, nom, source) dans l'ordre d'affichage
+        self._values = {}  # iid -> valeurs affichées
+        self._filtered: List[str] = []  # iid retenus par le filtre, dans l'ordre d'affichage
+        self._top = 0  # index dans self._filtered de la première ligne affichée
+        self._pool: List[str] = []  # éléments Tk réutilisés (un par ligne visible)
+        self._selected: Optional[str] = None  # iid (id SQLite) sélectionné, visible ou non
+        self._row_h = None  # hauteur de ligne / d'en-tête en pixels, mesurées sur le premier élément
+        self._header_h = None
+        self._measure_pending = False
+        # Premier remplissage une fois la fenêtre affichée : elle apparaît tout de suite, même avec un gros historique
+        self.status_var.set("Chargement de l'historique…")
+        self.after_idle(self._initial_load)
+
+    def _initial_load(self):
+        self.load_rows()
+        self.status_var.set("")
 
     # ---- Data ----
     def query_rows(self):
-        cur = self.con.cursor()
+        cur = self._cur
         cur.execute("""
-            SELECT opened_at, display_name, source, exists_now
+            SELECT id,
+                   substr(replace(coalesce(opened_at, ''), 'T', ' '), 1, 19),
+                   display_name, source,
+                   CASE WHEN exists_now THEN 'Oui' ELSE 'Non' END
             FROM items
-            ORDER BY datetime(opened_at) DESC
+            ORDER BY opened_at DESC
         """)
         return cur.fetchall()
 
+    def _iter_export_rows(self):
+        """
+        Lignes à exporter, lues au fil de l'eau par csv.writer (pas de fetchall).
+        'exists' suit la même règle que la colonne « Existe » du tableau (le .lnk est encore dans Recent).
+        """
+        cur = self.con.cursor()
+        cur.execute("""
+            SELECT opened_at, display_name, source, CASE WHEN exists_now THEN '1' ELSE '0' END
+            FROM items
+            ORDER BY opened_at DESC
+        """)
+        present = self._recent_set()
+        if present is None:
+            return cur  # dossier illisible : valeur enregistrée en base, comme le tableau
+        normcase = os.path.normcase
+        return ((opened_at, name, source, "1" if normcase(f"{name}.lnk") in present else "0")
+                for opened_at, name, source, _ in cur)
+
     # ---- Recherche avancée ----
     def _build_search_predicate(self):
         """
@@ -360,53 +538,199 @@ class App(tk.Tk):
         raw = self.search_var.get().strip()
         if not raw:
             return lambda name, source: True
+        return _make_predicate(raw)  # un prédicat par texte, mémorisé (lru_cache)
+
+    def load_rows(self):
+        """
+        (Re)charge les lignes de la base (iid = id SQLite), puis applique le filtre.
+        Aucun élément Tk n'est créé ici : _render n'affiche que la fenêtre visible.
+        """
+        values_by_iid = {}
+        rows = []
+        present = self._recent_set()
+        normcase = os.path.normcase
+        for row in self.query_rows():  # (id, date, nom, source, Oui/Non) déjà formatés par SQLite
+            iid = str(row[0])
+            name, source = row[2], row[3]
+            if present is None:
+                values = row[1:]
+            else:
+                # Colonne "Existe" = le .lnk est encore dans Recent (état courant, pas celui du dernier scan)
+                values = row[1:4] + ("Oui" if normcase(f"{name}.lnk") in present else "Non",)
+            values_by_iid[iid] = values
+            rows.append((iid, name, source))
+        self._values = values_by_iid
+        self._rows = rows
+        if self._selected not in values_by_iid:
+            self._selected = None
+        self.refresh_table()
 
-        # Regex entre /.../
+    @staticmethod
+    def _recent_set() -> Optional[set]:
+        """Noms (normcase) du dossier Recent : un seul os.scandir au lieu d'un exists() par ligne."""
+        try:
+            with os.scandir(str(RECENT_DIR)) as it:
+                return {os.path.normcase(e.name) for e in it}
+        except OSError:
+            return None  # dossier illisible : on garde la valeur enregistrée en base
+
+    def _matching_ids_sql(self, raw: str) -> Optional[set]:
+        """
+        Même logique que _build_search_predicate, mais évaluée par SQLite sur nom et source :
+          - /regex/ => REMATCH (fonction Python enregistrée, insensible à la casse)
+          - * ?     => *_lc GLOB motif en minuscules (syntaxe fnmatch convertie par _fnmatch_to_glob)
+          - sinon   => *_lc LIKE '%texte%' en minuscules
+        La casse est repliée par str.lower (colonnes *_lc et motif), donc aussi hors ASCII.
+        Retourne l'ensemble des iid correspondants, ou None si la recherche est vide.
+        """
+        if not raw:
+            return None
         if len(raw) >= 2 and raw.startswith("/") and raw.endswith("/"):
             pattern = raw[1:-1]
             try:
-                reg = re.compile(pattern, re.IGNORECASE)
-                return lambda name, source: bool(reg.search(name or "") or reg.search(source or ""))
+                _compiled_regex(pattern)
+                return self._select_ids(_SQL_IDS_REMATCH, (pattern,))
             except re.error:
-                lowered = raw.lower()
-                return lambda name, source: (lowered in (name or "").lower() or
-                                             lowered in (source or "").lower())
-
-        # Jokers * ?
-        if "*" in raw or "?" in raw:
-            pat = raw.lower()
-            return lambda name, source: (
-                fnmatch.fnmatch((name or "").lower(), pat) or
-                fnmatch.fnmatch((source or "").lower(), pat)
-            )
-
-        # Substring classique
-        lowered = raw.lower()
-        return lambda name, source: (
-            lowered in (name or "").lower() or
-            lowered in (source or "").lower()
-        )
+                pass  # regex invalide : recherche du texte brut, comme le prédicat Python
+        elif "*" in raw or "?" in raw:
+            pat = _fnmatch_to_glob(raw.lower())
+            return self._select_ids(_SQL_IDS_GLOB, (pat, pat))
+        like = "%" + raw.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        return self._select_ids(_SQL_IDS_LIKE, (like, like))
+
+    def _select_ids(self, sql: str, args) -> set:
+        cur = self._cur
+        cur.execute(sql, args)
+        return {str(row_id) for (row_id,) in cur}
+
+    def _on_search_changed(self, *_):
+        if self._search_pending is not None:
+            self.after_cancel(self._search_pending)
+        self._search_pending = self.after(200, self._search_debounced)
+
+    def _search_debounced(self):
+        """Filtre maintenant ; aussi appelé par Entrée / le bouton, qui annulent le filtrage encore en attente."""
+        if self._search_pending is not None:
+            self.after_cancel(self._search_pending)
+            self._search_pending = None
+        self._top = 0  # nouveau filtre : retour en haut de la liste
+        self.refresh_table()
 
     def refresh_table(self):
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-
-        predicate = self._build_search_predicate()
-
-        for opened_at, name, source, exists_now in self.query_rows():
-            if not predicate(name, source):
-                continue
-            exists_label = "Oui" if exists_now else "Non"
-            opened_at_disp = (opened_at or "").replace("T", " ")[:19]
-            self.tree.insert("", "end", values=(opened_at_disp, name, source, exists_label))
+        """Applique le filtre (liste d'iid dans self._filtered) puis réaffiche la fenêtre visible."""
+        try:
+            ids = self._matching_ids_sql(self.search_var.get().strip())
+        except sqlite3.Error:
+            ids = None  # motif refusé par SQLite (trop complexe, etc.) : filtre Python
+        if ids is not None:
+            keep = [iid for iid, _, _ in self._rows if iid in ids]
+        else:
+            predicate = self._build_search_predicate()
+            keep = [iid for iid, name, source in self._rows if predicate(name, source)]
+        self._filtered = keep
+        self._render()
+
+    # ---- Liste virtuelle ----
+    def _visible_count(self) -> int:
+        """Nombre de lignes entièrement visibles dans la hauteur actuelle du Treeview."""
+        row_h = self._row_h or 20
+        header_h = self._header_h if self._header_h is not None else row_h + 4
+        return max(1, (self.tree.winfo_height() - header_h) // row_h)
+
+    def _render(self):
+        """
+        Affiche self._filtered[self._top : self._top + visibles] dans le pool d'éléments Tk
+        (créés / supprimés seulement quand la hauteur change), puis recale sélection et barre verticale.
+        """
+        n = len(self._filtered)
+        count = self._visible_count()
+        self._top = max(0, min(self._top, n - count))
+        shown = self._filtered[self._top:self._top + count]
+
+        tree = self.tree
+        while len(self._pool) < len(shown):
+            self._pool.append(tree.insert("", "end", iid=f"v{len(self._pool)}"))
+        if len(self._pool) > len(shown):
+            tree.delete(*self._pool[len(shown):])
+            del self._pool[len(shown):]
+        for item, iid in zip(self._pool, shown):
+            tree.item(item, values=self._values[iid])
+
+        wanted = ()
+        if self._selected in shown:
+            wanted = (self._pool[shown.index(self._selected)],)
+        if tree.selection() != wanted:
+            tree.selection_set(wanted)
+            if wanted:
+                tree.focus(wanted[0])
+
+        if n:
+            self._yscroll.set(self._top / n, (self._top + len(shown)) / n)
+        else:
+            self._yscroll.set(0.0, 1.0)
+        if self._row_h is None and self._pool and not self._measure_pending:
+            self._measure_pending = True
+            self.after_idle(self._measure_rows)
+
+    def _measure_rows(self):
+        """Hauteurs réelles (ligne, en-tête) lues sur le premier élément affiché, puis nouveau rendu."""
+        self._measure_pending = False
+        bbox = self.tree.bbox(self._pool[0]) if self._pool else ""
+        if bbox:
+            self._header_h, self._row_h = bbox[1], bbox[3]
+            self._render()
+
+    def _scroll_to(self, top: int):
+        if top != self._top:
+            self._top = top
+            self._render()
+
+    def _on_yscroll(self, *args):
+        """Commande de la barre verticale : ('moveto', fraction) ou ('scroll', n, 'units'|'pages')."""
+        if args[0] == "moveto":
+            self._scroll_to(int(float(args[1]) * len(self._filtered)))
+        elif args[0] == "scroll":
+            step = len(self._pool) if args[2] == "pages" else 1
+            self._scroll_to(self._top + int(args[1]) * step)
+
+    def _on_mousewheel(self, event):
+        self._scroll_to(self._top + (-3 if event.delta > 0 else 3))
+        return "break"
+
+    def _on_key_nav(self, event):
+        """Flèches / Page préc.-suiv. / Début / Fin : déplace la sélection dans toute la liste filtrée."""
+        n = len(self._filtered)
+        if not n:
+            return "break"
+        try:
+            pos = self._filtered.index(self._selected)
+            page = max(1, len(self._pool) - 1)
+            pos = {"Up": pos - 1, "Down": pos + 1, "Prior": pos - page, "Next": pos + page,
+                   "Home": 0, "End": n - 1}[event.keysym]
+        except ValueError:  # rien de sélectionné (ou hors filtre) : on part de la première ligne visible
+            pos = {"Home": 0, "End": n - 1}.get(event.keysym, self._top)
+        pos = max(0, min(pos, n - 1))
+        self._selected = self._filtered[pos]
+        if pos < self._top:
+            self._top = pos
+        elif pos >= self._top + len(self._pool):
+            self._top = pos - len(self._pool) + 1
+        self._render()
+        return "break"
+
+    def _on_tree_select(self, event):
+        """Clic dans le tableau : retient l'iid de la ligne affichée par l'élément sélectionné du pool."""
+        sel = self.tree.selection()
+        if sel and sel[0] in self._pool:
+            pos = self._top + self._pool.index(sel[0])
+            if pos < len(self._filtered):
+                self._selected = self._filtered[pos]
 
     # ---- Helpers sélection ----
     def _get_selected_name(self) -> Optional[str]:
-        sel = self.tree.selection()
-        if not sel:
+        if self._selected is None or self._selected not in self._filtered:
             return None
-        vals = self.tree.item(sel[0], "values")
-        return vals[1] if vals and len(vals) >= 2 else None
+        return self._values[self._selected][1]
 
     # ---- Gestion des .lnk (restauration si besoin) ----
     def _ensure_lnk_exists(self, name: str) -> Optional[Path]:
@@ -420,8 +744,7 @@ class App(tk.Tk):
         if lnk.exists():
             return lnk
 
-        backup_dir = get_backup_dir()
-        backup_lnk = backup_dir / f"{name}.lnk"
+        backup_lnk = BACKUP_DIR / f"{name}.lnk"
         if backup_lnk.exists():
             try:
                 RECENT_DIR.mkdir(parents=True, exist_ok=True)
@@ -447,8 +770,9 @@ class App(tk.Tk):
         if not lnk:
             return
         try:
-            cmd = f'explorer /select,"{lnk.resolve()}"'
-            subprocess.Popen(cmd, shell=True)
+            # Sans shell (pas de cmd.exe intermédiaire). Ligne de commande passée telle quelle à CreateProcess :
+            # une liste argv ferait citer "/select,..." en entier par list2cmdline, ce qu'explorer ne comprend pas.
+            subprocess.Popen(f'explorer /select,"{os.path.abspath(lnk)}"')
         except Exception as e:
             messagebox.showerror(APP_NAME, f"Impossible d’ouvrir dans l’Explorateur.\n{e}")
 
@@ -465,25 +789,57 @@ class App(tk.Tk):
 
     # ---- Actions UI ----
     def scan_now(self):
-        count, _ = scan_recent(self.con)
-        self.refresh_table()
+        """Lance le scan (+ sauvegarde des .lnk) dans un thread : l'interface reste utilisable."""
+        self._scan_btn.config(state="disabled")
+        self.status_var.set("Scan en cours…")
+        threading.Thread(target=self._scan_worker, daemon=True).start()
+
+    def _scan_worker(self):
+        # Connexion dédiée : un objet sqlite3.Connection ne se partage pas entre threads
+        try:
+            con = ensure_db()
+            try:
+                count, _ = scan_recent(con)
+            finally:
+                con.close()
+        except Exception as e:
+            self.after(0, self._scan_done, None, e)
+        else:
+            self.after(0, self._scan_done, count, None)
+
+    def _scan_done(self, count, error):
+        """Retour dans le thread Tk : rafraîchit le tableau et réactive le bouton."""
+        self._scan_btn.config(state="normal")
+        self.status_var.set("")
+        if error is not None:
+            messagebox.showerror(APP_NAME, f"Échec du scan :\n{error}")
+            return
+        self.load_rows()
         messagebox.showinfo(APP_NAME, f"Scan terminé : {count} éléments parcourus.")
 
+    def _select_under(self, event) -> Optional[str]:
+        """Sélectionne la ligne sous la souris (sans événement <<TreeviewSelect>> si elle l'est déjà seule)."""
+        item = self.tree.identify_row(event.y)
+        if not item or item not in self._pool:
+            return None
+        pos = self._top + self._pool.index(item)
+        if pos >= len(self._filtered):
+            return None
+        self._selected = self._filtered[pos]
+        if self.tree.selection() != (item,):
+            self.tree.selection_set(item)
+            self.tree.focus(item)
+        return self._selected
+
     def _on_double_click_row(self, event):
         """Double-clic gauche : sélectionne la ligne + ouvre **la cible**."""
-        row_id = self.tree.identify_row(event.y)
-        if not row_id:
+        if not self._select_under(event):
             return
-        self.tree.selection_set(row_id)
-        self.tree.focus(row_id)
         self.open_target()
 
     def _on_right_click(self, event):
         """Clic droit : sélectionne la ligne sous la souris + affiche le menu contextuel."""
-        row_id = self.tree.identify_row(event.y)
-        if row_id:
-            self.tree.selection_set(row_id)
-            self.tree.focus(row_id)
+        self._select_under(event)
         try:
             self.context_menu.tk_popup(event.x_root, event.y_root)
         finally:
@@ -536,12 +892,14 @@ class App(tk.Tk):
         )
         if not path:
             return
-        rows = self.query_rows()
-        with open(path, "w", newline="", encoding="utf-8") as f:
-            w = csv.writer(f, delimiter=";")
-            w.writerow(["opened_at", "name", "source", "exists"])
-            for opened_at, name, source, exists_now in rows:
-                w.writerow([opened_at, name, source, "1" if exists_now else "0"])
+        try:
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                w = csv.writer(f, delimiter=";")
+                w.writerow(["opened_at", "name", "source", "exists"])
+                w.writerows(self._iter_export_rows())
+        except OSError as e:
+            messagebox.showerror(APP_NAME, f"Erreur lors de l'export :\n{e}")
+            return
         messagebox.showinfo(APP_NAME, f"Exporté : {path}")
 
     def backup_db(self):
@@ -555,20 +913,44 @@ class App(tk.Tk):
         )
         if not path:
             return
+        self._backup_btn.config(state="disabled")
+        self.status_var.set("Sauvegarde en cours…")
+        threading.Thread(target=self._backup_worker, args=(path,), daemon=True).start()
+
+    def _backup_worker(self, path: str):
+        # API de sauvegarde SQLite : copie cohérente même si une écriture (scan) est en cours,
+        # par lots de 1024 pages. Connexion source dédiée (self.con appartient au thread Tk).
+        def progress(status, remaining, total):
+            if total:
+                self.after(0, self.status_var.set, f"Sauvegarde… {100 * (total - remaining) // total} %")
         try:
-            shutil.copy2(DB_PATH, path)
-            messagebox.showinfo(APP_NAME, f"Base sauvegardée avec succès :\n{path}")
+            src = sqlite3.connect(DB_PATH)
+            dst = sqlite3.connect(path)
+            try:
+                src.backup(dst, pages=1024, progress=progress)
+            finally:
+                dst.close()
+                src.close()
         except Exception as e:
-            messagebox.showerror(APP_NAME, f"Erreur lors de la sauvegarde :\n{e}")
+            self.after(0, self._backup_done, path, e)
+        else:
+            self.after(0, self._backup_done, path, None)
+
+    def _backup_done(self, path: str, error):
+        self._backup_btn.config(state="normal")
+        self.status_var.set("")
+        if error is not None:
+            messagebox.showerror(APP_NAME, f"Erreur lors de la sauvegarde :\n{error}")
+            return
+        messagebox.showinfo(APP_NAME, f"Base sauvegardée avec succès :\n{path}")
 
     def show_about(self):
-        backup_dir = get_backup_dir()
         msg = (
             f"{APP_NAME}\n"
             f"Version : {APP_VERSION}\n"
             f"Auteur : {APP_AUTHOR}\n\n"
             f"Base de données :\n{DB_PATH}\n\n"
-            f"Sauvegarde des liens (.lnk) :\n{backup_dir}"
+            f"Sauvegarde des liens (.lnk) :\n{BACKUP_DIR}"
         )
         messagebox.showinfo("À propos", msg)
 
@@ -582,14 +964,10 @@ def first_scan_if_needed(con):
 def main_gui():
     con = ensure_db()
     first_scan_if_needed(con)
-    App().mainloop()
+    App(con).mainloop()
 
 if __name__ == "__main__":
-    # Mode planifié
-    if "--weekly-scan" in sys.argv:
-        run_weekly_scan_once()
-        sys.exit(0)
-
+    # (mode planifié --weekly-scan : traité plus haut, avant l'import de tkinter)
     if not RECENT_DIR.exists():
         tk.Tk().withdraw()
         messagebox.showerror(APP_NAME, f"Dossier 'Recent' introuvable:\n{RECENT_DIR}")